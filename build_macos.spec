@@ -19,6 +19,8 @@ a = Analysis(
         'multiprocessing.spawn',
         'src.core.cards',
         'src.core.ranks',
+        'src.core._eval_numba',
+        'src.core._lut',
         'src.core.partition',
         'src.core.house_way',
         'src.core.simulate',
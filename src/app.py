@@ -9,26 +9,49 @@ PROJECT_ROOT = os.path.dirname(BASE_DIR)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from PySide6.QtCore import QFile, QTextStream
-from PySide6.QtWidgets import QApplication
-
-from src.gui.main_window import MainWindow
 from src.utils.resources import get_resource_path
 
+# Qt and the GUI modules are imported inside the functions below: spawned
+# simulation worker processes re-import this module as __mp_main__ (and a
+# frozen build runs it before freeze_support), and they should load neither.
+
+
+# Stylesheet text, read once per process and reused by later main() calls
+_QSS_CACHE: str | None = None
+
+
+def _load_qss() -> str:
+    global _QSS_CACHE
+    if _QSS_CACHE is None:
+        from PySide6.QtCore import QFile, QTextStream
+        _QSS_CACHE = ""
+        qss_path = get_resource_path("src/gui/style.qss")
+        if os.path.exists(qss_path):
+            f = QFile(qss_path)
+            if f.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
+                _QSS_CACHE = str(QTextStream(f).readAll())
+                f.close()
+    return _QSS_CACHE
+
 
 def main():
     # Required for multiprocessing support in frozen executables
     multiprocessing.freeze_support()
-    
+
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+
+    from src.gui.main_window import MainWindow
+
+    # Merge queued mouse-move / resize events so slider and window drags
+    # dispatch only the latest one (the default on some platforms only)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
     app = QApplication(sys.argv)
     
     # Apply QSS using resource path helper
-    qss_path = get_resource_path("src/gui/style.qss")
-    if os.path.exists(qss_path):
-        f = QFile(qss_path)
-        if f.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
-            app.setStyleSheet(str(QTextStream(f).readAll()))
-            f.close()
+    qss = _load_qss()
+    if qss:
+        app.setStyleSheet(qss)
 
     w = MainWindow()
     w.resize(1100, 700)
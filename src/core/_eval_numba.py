@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+"""
+Numba kernels for 4-card scoring.
+
+Numba is optional: when it is not installed (or ASIA_POKER_NO_NUMBA=1 is
+set) ``HAVE_NUMBA`` is False and callers should use the pure-Python
+evaluator in ranks.py instead.  The kernels still import and run without
+Numba, just slowly.
+
+Scores are packed into one int as ``cat << 16 | k0 << 12 | k1 << 8 |
+k2 << 4 | k3`` with unused keys set to zero.  Every key is a rank 2..14, so
+4-bit fields are enough and integer order equals (cat, keys) tuple order.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+try:
+    if int(os.environ.get("ASIA_POKER_NO_NUMBA", "0")):
+        raise ImportError("disabled by ASIA_POKER_NO_NUMBA")
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# A frozen build ships no .py sources, which numba's on-disk cache needs to
+# locate (older releases fail at decoration time); compile in memory there.
+_CACHE = not getattr(sys, "frozen", False)
+
+
+# Category codes (must match ranks.CAT_*)
+_CAT_SF = 7
+_CAT_FOUR = 6
+_CAT_FLUSH = 5
+_CAT_STRAIGHT = 4
+_CAT_TRIPS = 3
+_CAT_TWO_PAIR = 2
+_CAT_PAIR = 1
+_CAT_HIGH = 0
+
+# Straight windows as key tuples, same order as ranks.STRAIGHTS
+STRAIGHT_WINDOWS = np.array([
+    (14, 5, 4, 3),
+    (14, 13, 12, 11),
+    (13, 12, 11, 10),
+    (12, 11, 10, 9),
+    (11, 10, 9, 8),
+    (10, 9, 8, 7),
+    (9, 8, 7, 6),
+    (8, 7, 6, 5),
+    (7, 6, 5, 4),
+    (6, 5, 4, 3),
+    (5, 4, 3, 2),
+], dtype=np.int8)
+
+
+@njit(cache=_CACHE)
+def pack4(cat, k0, k1, k2, k3):
+    return (cat << 16) | (k0 << 12) | (k1 << 8) | (k2 << 4) | k3
+
+
+@njit(cache=_CACHE)
+def eval4(vals, suits):
+    """Score 4 cards given int8 rank values (2..14) and suit codes (0..3)."""
+    flush = suits[0] == suits[1] and suits[1] == suits[2] and suits[2] == suits[3]
+
+    cnt = np.zeros(15, np.int8)
+    for i in range(4):
+        cnt[vals[i]] += 1
+
+    for w in range(STRAIGHT_WINDOWS.shape[0]):
+        if (cnt[STRAIGHT_WINDOWS[w, 0]] and cnt[STRAIGHT_WINDOWS[w, 1]]
+                and cnt[STRAIGHT_WINDOWS[w, 2]] and cnt[STRAIGHT_WINDOWS[w, 3]]):
+            cat = _CAT_SF if flush else _CAT_STRAIGHT
+            return pack4(cat, np.int64(STRAIGHT_WINDOWS[w, 0]),
+                         np.int64(STRAIGHT_WINDOWS[w, 1]),
+                         np.int64(STRAIGHT_WINDOWS[w, 2]),
+                         np.int64(STRAIGHT_WINDOWS[w, 3]))
+
+    # Ranks high to low, repeated by multiplicity; plus quad/trip/pair values
+    desc = np.zeros(4, np.int64)
+    n = 0
+    quad = 0
+    trip = 0
+    pair_hi = 0
+    pair_lo = 0
+    for v in range(14, 1, -1):
+        c = cnt[v]
+        for _ in range(c):
+            desc[n] = v
+            n += 1
+        if c == 4:
+            quad = v
+        elif c == 3:
+            trip = v
+        elif c == 2:
+            if pair_hi == 0:
+                pair_hi = v
+            else:
+                pair_lo = v
+
+    if quad:
+        return pack4(_CAT_FOUR, quad, 0, 0, 0)
+    if flush:
+        return pack4(_CAT_FLUSH, desc[0], desc[1], desc[2], desc[3])
+    if trip:
+        kicker = desc[3] if desc[0] == trip else desc[0]
+        return pack4(_CAT_TRIPS, trip, kicker, 0, 0)
+    if pair_lo:
+        return pack4(_CAT_TWO_PAIR, pair_hi, pair_lo, 0, 0)
+    if pair_hi:
+        k = np.zeros(2, np.int64)
+        m = 0
+        for i in range(4):
+            if desc[i] != pair_hi:
+                k[m] = desc[i]
+                m += 1
+        return pack4(_CAT_PAIR, pair_hi, k[0], k[1], 0)
+    return pack4(_CAT_HIGH, desc[0], desc[1], desc[2], desc[3])
+
+
+@njit(cache=_CACHE)
+def eval4_joker(vals, suits):
+    """Best legal Joker substitution for the three known cards in slots 0..2.
+
+    The Joker plays as an Ace, or as any card that completes a straight,
+    flush, or straight flush, so the answer is decided directly: the best
+    straight window holding all three ranks (a straight flush when suited),
+    else an Ace.  Slot 3 is overwritten.
+    """
+    suited = suits[0] == suits[1] and suits[1] == suits[2]
+    best_run = 0
+    if vals[0] != vals[1] and vals[1] != vals[2] and vals[0] != vals[2]:
+        cat = _CAT_SF if suited else _CAT_STRAIGHT
+        for w in range(STRAIGHT_WINDOWS.shape[0]):
+            hits = 0
+            for i in range(3):
+                for j in range(4):
+                    if vals[i] == STRAIGHT_WINDOWS[w, j]:
+                        hits += 1
+            if hits == 3:
+                sc = pack4(cat, np.int64(STRAIGHT_WINDOWS[w, 0]),
+                           np.int64(STRAIGHT_WINDOWS[w, 1]),
+                           np.int64(STRAIGHT_WINDOWS[w, 2]),
+                           np.int64(STRAIGHT_WINDOWS[w, 3]))
+                if sc > best_run:
+                    best_run = sc
+    if best_run:
+        return best_run
+
+    # An Ace of the trio's suit is always the best remaining choice (a flush
+    # when suited); the Joker may duplicate a held Ace
+    vals[3] = 14
+    suits[3] = suits[0]
+    return eval4(vals, suits)
+
+
+# ── 4-card lookup table ───────────────────────────────────────
+# Cards are dense indices 0..52 (suit_idx * 13 + rank_idx, Joker = 52).  A
+# sorted 4-card combo a < b < c < d maps to its combinadic rank
+# C(a,1) + C(b,2) + C(c,3) + C(d,4), giving a table of C(53,4) entries.
+
+N_CARDS = 53
+JOKER_INDEX = 52
+N_COMBOS4 = 292825  # C(53, 4)
+
+BINOM = np.zeros((N_CARDS, 5), dtype=np.int64)
+for _n in range(N_CARDS):
+    BINOM[_n, 0] = 1
+    for _k in range(1, 5):
+        BINOM[_n, _k] = 0 if _n == 0 else BINOM[_n - 1, _k - 1] + BINOM[_n - 1, _k]
+
+
+@njit(cache=_CACHE)
+def fill_score4_lut(out):
+    """Fill *out* (length N_COMBOS4) with the packed score of every combo.
+
+    Combos containing the Joker hold the best legal substitution (see
+    eval4_joker).
+    """
+    vals = np.empty(4, np.int8)
+    suits = np.empty(4, np.int8)
+    for d in range(3, N_CARDS):
+        for c in range(2, d):
+            for b in range(1, c):
+                for a in range(b):
+                    idx = BINOM[a, 1] + BINOM[b, 2] + BINOM[c, 3] + BINOM[d, 4]
+                    vals[0] = a % 13 + 2
+                    suits[0] = a // 13
+                    vals[1] = b % 13 + 2
+                    suits[1] = b // 13
+                    vals[2] = c % 13 + 2
+                    suits[2] = c // 13
+                    if d == JOKER_INDEX:
+                        out[idx] = eval4_joker(vals, suits)
+                    else:
+                        vals[3] = d % 13 + 2
+                        suits[3] = d // 13
+                        out[idx] = eval4(vals, suits)
+
+
+# ── Dealer House Way ──────────────────────────────────────────
+
+@njit(cache=_CACHE)
+def house_way_batch(picks, lut, score2, score1, hi_uniq, idx2, idx1,
+                    out4, out2, out1):
+    """House Way (s4, s2, s1) for every row of *picks* (B, 7 card indices).
+
+    Rows of partitions follow partition.PARTITION_INDICES: hi_uniq[q] is the
+    4-card hand of rows 3q..3q+2, whose 2- and 1-card hands are idx2/idx1.
+    Picks the lexicographic max over non-foul rows, like set_dealer_421;
+    row 0 if all foul.
+    """
+    h = np.empty(7, np.int64)
+    for r in range(picks.shape[0]):
+        # Sort the hand so every 4-card subset is ascending for the LUT
+        for i in range(7):
+            v = picks[r, i]
+            j = i
+            while j > 0 and h[j - 1] > v:
+                h[j] = h[j - 1]
+                j -= 1
+            h[j] = v
+
+        best = np.int64(-1)
+        b4 = b2 = b1 = np.int64(0)
+        for q in range(hi_uniq.shape[0]):
+            s4 = np.int64(lut[BINOM[h[hi_uniq[q, 0]], 1] + BINOM[h[hi_uniq[q, 1]], 2]
+                              + BINOM[h[hi_uniq[q, 2]], 3] + BINOM[h[hi_uniq[q, 3]], 4]])
+            for k in range(3):
+                p = 3 * q + k
+                s2 = np.int64(score2[h[idx2[p, 0]], h[idx2[p, 1]]])
+                s1 = np.int64(score1[h[idx1[p, 0]]])
+                if p == 0:
+                    b4, b2, b1 = s4, s2, s1
+                if s4 < s2 or s2 < s1:
+                    continue
+                key = (s4 << 40) | (s2 << 20) | s1
+                if key > best:
+                    best = key
+                    b4, b2, b1 = s4, s2, s1
+        out4[r] = b4
+        out2[r] = b2
+        out1[r] = b1
+
+
+# ── Partition vs dealer tally ─────────────────────────────────
+# A hand's three sub-hand scores pack into one int64 as s4 << 42 | s2 << 21 |
+# s1 (ranks.pack_hand).  Scores are below 2**19, so bit 20 of every 21-bit
+# field is free: setting it in the minuend and subtracting leaves it set iff
+# that field did not borrow, i.e. iff minuend field >= subtrahend field.  One
+# subtract thus compares all three sub-hands (SWAR).
+
+HAND_GUARDS = (1 << 20) | (1 << 41) | (1 << 62)
+
+
+@njit(cache=_CACHE)
+def tally_packed(pk, dk, W, L, P):
+    """Add wins/losses/pushes of each player hand pk[i] against all of dk.
+
+    A hand wins when at most one sub-hand fails to beat the dealer (at most
+    one guard left set by dk - pk; ``g & (g - 1) == 0``), loses likewise with
+    the operands swapped, and pushes otherwise.
+    """
+    n = dk.shape[0]
+    for i in range(pk.shape[0]):
+        a = pk[i]
+        ah = a | HAND_GUARDS
+        w = 0
+        l = 0
+        for j in range(n):
+            b = dk[j]
+            g = ((b | HAND_GUARDS) - a) & HAND_GUARDS  # set: dealer >= player
+            if g & (g - 1) == 0:
+                w += 1
+            else:
+                g = (ah - b) & HAND_GUARDS  # set: player >= dealer
+                if g & (g - 1) == 0:
+                    l += 1
+        W[i] += w
+        L[i] += l
+        P[i] += n - w - l
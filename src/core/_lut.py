@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+"""
+Precomputed 4-card score table.
+
+SCORE4_LUT holds the packed score (see _eval_numba) of every 4-card combo
+from the 53-card deck, Joker included, indexed by the combinadic rank of the
+sorted card indices.  Scoring a 4-card hand is then four table lookups and one
+array load.
+
+The table is built once (Numba kernel when available, else a pure-Python
+loop over the supplied evaluator) and persisted with np.save under the cache
+directory, so later startups and worker processes just read the file.
+"""
+
+import os
+from itertools import combinations
+from typing import Callable, Sequence
+
+import numpy as np
+
+from ._eval_numba import (_CAT_SF, _CAT_STRAIGHT, BINOM, HAVE_NUMBA, JOKER_INDEX,
+                          N_CARDS, N_COMBOS4, STRAIGHT_WINDOWS, fill_score4_lut)
+
+_LUT_FILE = "score4_lut_v1.npy"
+_LUT_DTYPE = np.uint32
+
+# Combinadic weights per sorted position: idx = C1[a] + C2[b] + C3[c] + C4[d]
+C1, C2, C3, C4 = (BINOM[:, k].tolist() for k in range(1, 5))
+
+
+def combo4_index(a: int, b: int, c: int, d: int) -> int:
+    """Combinadic rank of card indices sorted ascending (a < b < c < d)."""
+    return C1[a] + C2[b] + C3[c] + C4[d]
+
+
+# (rank bitmask, keys) per straight window; bit v is set for rank v
+_WINDOWS = [(sum(1 << v for v in w), tuple(w)) for w in STRAIGHT_WINDOWS.tolist()]
+
+
+def _joker_py(eval4, vals: Sequence[int], suits: Sequence[int]) -> int:
+    """Best legal Joker substitution for three known cards (see eval4_joker)."""
+    suited = suits[0] == suits[1] == suits[2]
+    held = (1 << vals[0]) | (1 << vals[1]) | (1 << vals[2])
+    if bin(held).count("1") == 3:
+        runs = [w for m, w in _WINDOWS if held & m == held]
+        if runs:
+            k0, k1, k2, k3 = max(runs)
+            cat = _CAT_SF if suited else _CAT_STRAIGHT
+            return (cat << 16) | (k0 << 12) | (k1 << 8) | (k2 << 4) | k3
+    return eval4((*vals, 14), (*suits, suits[0]))
+
+
+def _build_py(eval4: Callable[[Sequence[int], Sequence[int]], int]) -> np.ndarray:
+    """Pure-Python table build; *eval4(vals, suits)* returns a packed score."""
+    lut = np.zeros(N_COMBOS4, dtype=_LUT_DTYPE)
+    vs = [(i % 13 + 2, i // 13) for i in range(JOKER_INDEX)]
+    for a, b, c, d in combinations(range(N_CARDS), 4):
+        (va, sa), (vb, sb), (vc, sc) = vs[a], vs[b], vs[c]
+        if d != JOKER_INDEX:
+            vd, sd = vs[d]
+            score = eval4((va, vb, vc, vd), (sa, sb, sc, sd))
+        else:
+            score = _joker_py(eval4, (va, vb, vc), (sa, sb, sc))
+        lut[combo4_index(a, b, c, d)] = score
+    return lut
+
+
+def build_score4_lut(eval4: Callable[[Sequence[int], Sequence[int]], int]) -> np.ndarray:
+    """Build the table with the Numba kernel, or *eval4* without Numba."""
+    if HAVE_NUMBA:
+        lut = np.zeros(N_COMBOS4, dtype=np.int64)
+        fill_score4_lut(lut)
+        return lut.astype(_LUT_DTYPE)
+    return _build_py(eval4)
+
+
+def load_score4_lut(eval4: Callable[[Sequence[int], Sequence[int]], int]) -> np.ndarray:
+    """Load the persisted table, building (and saving) it if missing."""
+    from ..utils.resources import get_cache_dir
+
+    path = os.path.join(get_cache_dir(), _LUT_FILE)
+    try:
+        lut = np.load(path)
+        if lut.shape == (N_COMBOS4,) and lut.dtype == _LUT_DTYPE:
+            return lut
+    except (OSError, ValueError, EOFError):
+        pass  # missing, truncated or foreign file: rebuild below
+
+    lut = build_score4_lut(eval4)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, lut)
+        os.replace(tmp, path)  # atomic: concurrent workers may build too
+    except OSError:
+        pass  # read-only location; rebuild next time
+    return lut
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 # Suits and ranks
 SUITS = ("S", "H", "D", "C")  # Spades, Hearts, Diamonds, Clubs
@@ -12,17 +12,46 @@ RANK_TO_VAL = {r: i + 2 for i, r in enumerate(RANKS)}  # 2..14 (A=14)
 VAL_TO_RANK = {v: r for r, v in RANK_TO_VAL.items()}
 
 
-@dataclass(frozen=True)
+def validate_card(rank: str, suit: Optional[str]) -> None:
+    """Raise ValueError unless (rank, suit) names a card of the deck."""
+    if rank == JOKER:
+        return
+    if rank not in RANKS:
+        raise ValueError(f"Invalid rank: {rank}")
+    if suit not in SUITS:
+        raise ValueError(f"Invalid suit: {suit}")
+
+
+# Interned instances, one per card; filled below once the class exists
+_INTERN: Dict[Tuple[str, Optional[str]], "Card"] = {}
+
+
+@dataclass(frozen=True, eq=False, init=False)
 class Card:
+    """A playing card.  Instances are interned: Card("A", "S") always returns
+    the same object, so equality and hashing are identity-based (eq=False
+    keeps object.__eq__/__hash__) and never hash the strings.  Construction
+    is a pool lookup; validation only runs while the pool is being built."""
+
     rank: str  # "2".."10","J","Q","K","A" or "XJ" for Joker
     suit: Optional[str]  # "S","H","D","C" or None for Joker
 
-    def __post_init__(self):
-        if self.rank == JOKER:
-            object.__setattr__(self, "suit", None)
-        else:
-            assert self.rank in RANKS, f"Invalid rank: {self.rank}"
-            assert self.suit in SUITS, f"Invalid suit: {self.suit}"
+    def __new__(cls, rank: str, suit: Optional[str] = None):
+        if rank == JOKER:
+            suit = None
+        try:
+            return _INTERN[(rank, suit)]
+        except KeyError:
+            pass
+        validate_card(rank, suit)
+        card = super().__new__(cls)
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "suit", suit)
+        return card
+
+    def __reduce__(self):
+        # Unpickle / copy through __new__ so the pooled instance comes back
+        return (Card, (self.rank, self.suit))
 
     def id(self) -> str:
         return self.rank if self.rank == JOKER else f"{self.rank}{self.suit}"
@@ -42,20 +71,26 @@ class Card:
 
 def parse(card_id: str) -> Card:
     """Parse an id like AS, TD, 9H, 2C, or XJ for the Joker."""
+    try:
+        return _CARD_BY_ID[card_id]
+    except KeyError:
+        pass
     s = card_id.strip().upper()
-    if s == JOKER:
-        return Card(JOKER, None)
-    # 10 is two chars; others 1
-    if s[:-1] == "10":
-        rank = "10"
-        suit = s[-1]
-    else:
-        rank, suit = s[:-1], s[-1]
+    try:
+        return _CARD_BY_ID[s]
+    except KeyError:
+        pass
+    # Unknown id: report whether the rank or the suit is bad
+    rank, suit = s[:-1], s[-1:]
     if rank not in RANKS:
         raise ValueError(f"Bad card rank: {rank}")
-    if suit not in SUITS:
-        raise ValueError(f"Bad suit: {suit}")
-    return Card(rank, suit)
+    raise ValueError(f"Bad suit: {suit}")
+
+
+for _s in SUITS:
+    for _r in RANKS:
+        _INTERN[(_r, _s)] = Card(_r, _s)
+_INTERN[(JOKER, None)] = Card(JOKER, None)
 
 
 def full_deck(include_joker: bool = True) -> List[Card]:
@@ -65,13 +100,59 @@ def full_deck(include_joker: bool = True) -> List[Card]:
     return deck
 
 
+# Dense card index: suit_idx * 13 + rank_idx, Joker = 52 (full_deck order).
+# A hand's bitmask key is the OR of its cards' bits (1 << index): an
+# order-independent, hashable int.
+CARD_INDEX = {c: i for i, c in enumerate(full_deck(include_joker=True))}
+CARD_BIT = {c: 1 << i for c, i in CARD_INDEX.items()}
+JOKER_BIT = CARD_BIT[Card(JOKER, None)]
+BIT_TO_CARD = {bit: c for c, bit in CARD_BIT.items()}
+
+# parse() lookup: canonical ids plus the "T" alias for 10 (e.g. TD)
+_CARD_BY_ID = {c.id(): c for c in CARD_INDEX}
+_CARD_BY_ID.update({f"T{c.suit}": c for c in CARD_INDEX if c.rank == "10"})
+
+
+def cards_mask(cards: Iterable[Card]) -> int:
+    """Return the OR of CARD_BIT over *cards*."""
+    m = 0
+    for c in cards:
+        m |= CARD_BIT[c]
+    return m
+
+
+def mask_cards(mask: int) -> List[Card]:
+    """Decode a CARD_BIT mask back into its cards (lowest bit first)."""
+    out: List[Card] = []
+    while mask:
+        low = mask & -mask
+        out.append(BIT_TO_CARD[low])
+        mask ^= low
+    return out
+
+
+FULL_DECK_MASK = (1 << len(CARD_INDEX)) - 1
+
+
+def remaining_deck_bits(exclude: Iterable[Card], include_joker: bool = True) -> int:
+    """CARD_BIT mask of the deck minus *exclude*."""
+    full = FULL_DECK_MASK if include_joker else FULL_DECK_MASK & ~JOKER_BIT
+    return full & ~cards_mask(exclude)
+
+
 def remaining_deck(exclude: Sequence[Card], include_joker: bool = True) -> List[Card]:
-    excl = {c.id() for c in exclude}
-    return [c for c in full_deck(include_joker) if c.id() not in excl]
+    # Bits decode lowest first, i.e. in full_deck order
+    return mask_cards(remaining_deck_bits(exclude, include_joker))
+
+
+# Sort key val << 4 | suit order, matching the (val, suit or "Z") ordering:
+# suits compare alphabetically and the Joker sorts above every Ace
+_SUIT_ORDER = {s: i for i, s in enumerate(sorted(SUITS))}
+_SORTKEY = {c: (c.val << 4) | _SUIT_ORDER.get(c.suit, len(SUITS)) for c in CARD_INDEX}
 
 
 def sort_desc(cards: Sequence[Card]) -> List[Card]:
-    return sorted(cards, key=lambda c: (c.val, c.suit or "Z"), reverse=True)
+    return sorted(cards, key=_SORTKEY.__getitem__, reverse=True)
 
 
 # Pretty strings for UI
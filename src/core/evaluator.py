@@ -14,9 +14,15 @@ def evaluate_best_setup(
     seed: int | None = None,
     progress: Callable[[float], None] | None = None,
     cancel: Callable[[], bool] | None = None,
+    n_workers: int | None = None,
 ) -> Tuple[SimResult, List[SimResult]]:
-    """Public API used by the GUI to compute the best 4‑2‑1 arrangement."""
-    return simulate_best(hand, samples=samples, seed=seed, progress=progress, cancel=cancel)
+    """Public API used by the GUI to compute the best 4‑2‑1 arrangement.
+
+    *n_workers* caps the worker processes (default: ASIA_POKER_WORKERS or
+    min(cpu_count, 8)); 1 runs in-process.
+    """
+    return simulate_best(hand, samples=samples, seed=seed, progress=progress,
+                         cancel=cancel, n_workers=n_workers)
 
 
 def house_way_result(hand: Sequence[Card]) -> RankedPartition:
@@ -18,20 +18,86 @@ translation of that venue's decision tree, while preserving the same Score and
 Partition interfaces.
 """
 
-from typing import Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
+import numpy as np
+
+from ._eval_numba import HAVE_NUMBA, house_way_batch
 from .cards import Card
-from .partition import all_ranked_non_foul, RankedPartition
+from .partition import (_HI_UNIQ, IDX1, IDX2, RankedPartition, partition_at,
+                        rank_partitions, rank_partitions_idx)
+from .ranks import SCORE1_TABLE, SCORE2_TABLE, SCORE4_LUT
+
+
+def _house_way_row(arr: np.ndarray) -> int:
+    """Row of the lexicographically best non-foul partition (first on ties).
+
+    *arr* is a PARTITION_DTYPE array.  Packed scores are below 2**20, so
+    (s4, s2, s1) order equals s4 << 40 | s2 << 20 | s1 order and the pick is
+    one argmax.  If every partition fouls (shouldn't happen) row 0 is
+    returned.
+    """
+    key = (arr['s4'] << 40) | (arr['s2'] << 20) | arr['s1']
+    key[arr['fouled']] = -1
+    return int(key.argmax())
 
 
 def set_dealer_421(cards: Sequence[Card]) -> RankedPartition:
     """Deterministic House Way: pick best non‑foul lexicographically.
 
-    Returns a RankedPartition (includes cached scores) for downstream compare.
+    Returns a RankedPartition (includes cached scores) for downstream compare;
+    only the winning partition is materialized.
+    """
+    arr = rank_partitions(cards)
+    r = _house_way_row(arr)
+    row = arr[r]
+    return RankedPartition(partition_at(cards, r),
+                           (int(row['s4']), int(row['s2']), int(row['s1'])))
+
+
+# House Way scores by 7-card bitmask (OR of 1 << index), FIFO-capped
+_DEALER_CACHE: Dict[int, Tuple[int, int, int]] = {}
+_DEALER_CACHE_MAX = 1 << 16
+
+
+def dealer_scores_421(idx7: Sequence[int]) -> Tuple[int, int, int]:
+    """House Way (s4, s2, s1) for 7 dense card indices (see CARD_INDEX).
+
+    Same pick as set_dealer_421, but no Card tuples or RankedPartition objects
+    are built; the simulators only need the scores.  Results are memoized by
+    the hand's bitmask.
+    """
+    mask = 0
+    for i in idx7:
+        mask |= 1 << i
+    hit = _DEALER_CACHE.get(mask)
+    if hit is not None:
+        return hit
+
+    arr = rank_partitions_idx(np.sort(np.asarray(idx7, dtype=np.intp)), presorted=True)
+    r = _house_way_row(arr)
+    res = (int(arr['s4'][r]), int(arr['s2'][r]), int(arr['s1'][r]))
+    if len(_DEALER_CACHE) >= _DEALER_CACHE_MAX:
+        del _DEALER_CACHE[next(iter(_DEALER_CACHE))]  # evict oldest
+    _DEALER_CACHE[mask] = res
+    return res
+
+
+def clear_dealer_cache() -> None:
+    """Drop memoized House Way scores."""
+    _DEALER_CACHE.clear()
+
+
+def dealer_scores_batch(picks: np.ndarray, out4: np.ndarray, out2: np.ndarray,
+                        out1: np.ndarray) -> None:
+    """dealer_scores_421 for each row of a (B, 7) card-index array.
+
+    Fills the (B,) integer *out* arrays in one Numba call when available,
+    else row by row.
     """
-    cand = all_ranked_non_foul(cards)
-    if not cand:
-        # Foul all partitions shouldn't happen; fall back to arbitrary first
-        from .partition import RankedPartition as RP, generate_partitions
-        return RP(generate_partitions(cards)[0])
-    return max(cand, key=lambda rp: rp.key_house())
+    if HAVE_NUMBA:
+        house_way_batch(picks, SCORE4_LUT, SCORE2_TABLE, SCORE1_TABLE,
+                        _HI_UNIQ, IDX2, IDX1, out4, out2, out1)
+        return
+    for j in range(len(picks)):
+        out4[j], out2[j], out1[j] = dealer_scores_421(picks[j])
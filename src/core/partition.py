@@ -3,54 +3,133 @@ from __future__ import annotations
 from itertools import combinations
 from typing import Iterable, List, Sequence, Tuple
 
-from .cards import Card
-from .ranks import score1, score2, score4, Score
+import numpy as np
+
+from .cards import CARD_INDEX, Card
+from .ranks import (SCORE1_TABLE, SCORE2_TABLE, Score, score1, score2, score4,
+                    score4_batch)
 
 Partition = Tuple[Tuple[Card, ...], Tuple[Card, ...], Tuple[Card, ...]]  # (4,2,1)
 
 
+def _partition_indices() -> List[Tuple[Tuple[int, ...], Tuple[int, int], Tuple[int]]]:
+    """Positions (hi, mid, low) of all 105 partitions of 7 cards."""
+    rows = []
+    for hi in combinations(range(7), 4):
+        r0, r1, r2 = [i for i in range(7) if i not in hi]
+        # C(3,2) = 3 mid combos, each leaves 1 low card
+        rows.append((hi, (r0, r1), (r2,)))
+        rows.append((hi, (r0, r2), (r1,)))
+        rows.append((hi, (r1, r2), (r0,)))
+    return rows
+
+
+# Fixed index tables: row r of IDX4/IDX2/IDX1 selects partition r's cards.
+# The 35 distinct 4-card hands are scored once and fanned out via _HI_ROW.
+PARTITION_INDICES = _partition_indices()
+IDX4 = np.array([p[0] for p in PARTITION_INDICES], dtype=np.int8)   # (105, 4)
+IDX2 = np.array([p[1] for p in PARTITION_INDICES], dtype=np.int8)   # (105, 2)
+IDX1 = np.array([p[2] for p in PARTITION_INDICES], dtype=np.int8)   # (105, 1)
+PARTITIONS_IDX = (IDX4, IDX2, IDX1)
+_HI_UNIQ = np.array(list(combinations(range(7), 4)), dtype=np.int8)  # (35, 4)
+_HI_ROW = np.repeat(np.arange(len(_HI_UNIQ)), 3)                     # (105,)
+
+
+def partition_at(cards: Sequence[Card], r: int) -> Partition:
+    """Build the Card tuples of partition row *r* (see PARTITIONS_IDX).
+
+    Scoring and selection work on the index tables; only partitions that
+    are actually returned get materialized.
+    """
+    hi, (m0, m1), (lo,) = PARTITION_INDICES[r]
+    return (tuple(cards[i] for i in hi), (cards[m0], cards[m1]), (cards[lo],))
+
+
 def generate_partitions(cards: Sequence[Card]) -> List[Partition]:
     """Generate all C(7,4)*C(3,2) = 105 partitions of 7 cards into (4,2,1).
 
-    Uses index-based selection to avoid linear-scan `not in` checks.
+    Kept for API compatibility; prefer PARTITIONS_IDX and partition_at.
     """
     assert len(cards) == 7
-    cards_list = list(cards)
-    indices = range(7)
-    parts: List[Partition] = []
-    for hi_idx in combinations(indices, 4):
-        hi = tuple(cards_list[i] for i in hi_idx)
-        rem_idx = [i for i in indices if i not in hi_idx]
-        r0, r1, r2 = rem_idx
-        # C(3,2) = 3 mid combos, each leaves 1 low card
-        parts.append((hi, (cards_list[r0], cards_list[r1]), (cards_list[r2],)))
-        parts.append((hi, (cards_list[r0], cards_list[r2]), (cards_list[r1],)))
-        parts.append((hi, (cards_list[r1], cards_list[r2]), (cards_list[r0],)))
-    return parts
+    return [partition_at(cards, r) for r in range(len(PARTITION_INDICES))]
+
+
+def score_partitions(cards: Sequence[Card]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Packed (s4, s2, s1) scores of all 105 partitions, as (105,) arrays.
+
+    Row order matches generate_partitions.
+    """
+    return score_partitions_idx(np.array([CARD_INDEX[c] for c in cards], dtype=np.intp))
+
+
+def score_partitions_idx(
+    idx7: np.ndarray, presorted: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """score_partitions for 7 dense card indices (see CARD_INDEX).
+
+    Pass *presorted* when idx7 is ascending: every 4-card row is then already
+    sorted for the LUT, skipping a per-row sort.
+    """
+    hi = idx7[_HI_UNIQ]
+    s4 = score4_batch(hi if presorted else np.sort(hi, axis=1))[_HI_ROW]
+    mid = idx7[IDX2]
+    s2 = SCORE2_TABLE[mid[:, 0], mid[:, 1]]
+    s1 = SCORE1_TABLE[idx7[IDX1[:, 0]]]
+    return s4, s2, s1
+
+
+# One row per partition: packed scores plus the foul flag, contiguous (SoA
+# fields of a single 105-row buffer)
+PARTITION_DTYPE = np.dtype([('s4', np.int64), ('s2', np.int64), ('s1', np.int64),
+                            ('fouled', np.bool_)])
+
+
+def _ranked_array(s4: np.ndarray, s2: np.ndarray, s1: np.ndarray) -> np.ndarray:
+    arr = np.empty(len(s4), dtype=PARTITION_DTYPE)
+    arr['s4'] = s4
+    arr['s2'] = s2
+    arr['s1'] = s1
+    # Scores are packed ints, so the foul test is one mask
+    arr['fouled'] = (s4 < s2) | (s2 < s1)
+    return arr
+
+
+def rank_partitions(cards: Sequence[Card]) -> np.ndarray:
+    """All 105 partitions as a PARTITION_DTYPE array (generate_partitions order)."""
+    return _ranked_array(*score_partitions(cards))
+
+
+def rank_partitions_idx(idx7: np.ndarray, presorted: bool = False) -> np.ndarray:
+    """rank_partitions for 7 dense card indices (see score_partitions_idx)."""
+    return _ranked_array(*score_partitions_idx(idx7, presorted))
 
 
 class RankedPartition:
     __slots__ = ('hi', 'mid', 'low', 's4', 's2', 's1')
 
-    def __init__(self, part: Partition):
+    def __init__(self, part: Partition, scores: Tuple[Score, Score, Score] | None = None):
         self.hi, self.mid, self.low = part
-        self.s4: Score = score4(self.hi)
-        self.s2: Score = score2(self.mid)
-        self.s1: Score = score1(self.low)
+        if scores is None:
+            scores = (score4(self.hi), score2(self.mid), score1(self.low))
+        self.s4: Score
+        self.s2: Score
+        self.s1: Score
+        self.s4, self.s2, self.s1 = scores
 
     def foul(self) -> bool:
         # Must be s4 >= s2 >= s1 in poker ordering
-        return self.s4.tuple() < self.s2.tuple() or self.s2.tuple() < self.s1.tuple()
+        return self.s4 < self.s2 or self.s2 < self.s1
 
     def key_house(self):
         # Deterministic ordering approximating typical House Way preferences
-        return (self.s4.tuple(), self.s2.tuple(), self.s1.tuple())
+        return (self.s4, self.s2, self.s1)
 
 
 def all_ranked_non_foul(cards: Sequence[Card]) -> List[RankedPartition]:
+    arr = rank_partitions(cards)
+    keep = np.flatnonzero(~arr['fouled']).tolist()
+    s4, s2, s1 = arr['s4'].tolist(), arr['s2'].tolist(), arr['s1'].tolist()
     res: List[RankedPartition] = []
-    for p in generate_partitions(cards):
-        rp = RankedPartition(p)
-        if not rp.foul():
-            res.append(rp)
+    for r in keep:
+        res.append(RankedPartition(partition_at(cards, r), (s4[r], s2[r], s1[r])))
     return res
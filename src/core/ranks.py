@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
-from functools import lru_cache
-from typing import List, Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
-from .cards import Card, JOKER, RANK_TO_VAL, RANKS
+import numpy as np
+
+from ._lut import BINOM, C1, C2, C3, C4, load_score4_lut
+from .cards import CARD_INDEX, Card, full_deck
 
 # Categories ordered high to low
 CAT_SF = 7
@@ -17,20 +17,34 @@ CAT_TWO_PAIR = 2
 CAT_PAIR = 1
 CAT_HIGH = 0
 
+# A Score is a plain int packing the category and tie breakers (numeric ranks
+# 2..14, high to low) as cat << 16 | k0 << 12 | k1 << 8 | k2 << 4 | k3, unused
+# keys zero.  Keys never exceed 14, so integer order equals (cat, keys) tuple
+# order, and the same encoding is used by the Numba kernels and NumPy tables.
+Score = int
+
+
+def pack_score(cat: int, keys: Sequence[int]) -> Score:
+    """Pack a category and up to four tie-breaker ranks into a Score."""
+    packed = cat << 16
+    for shift, k in zip((12, 8, 4, 0), keys):
+        packed |= k << shift
+    return packed
+
 
-@dataclass(frozen=True)
-class Score:
-    cat: int
-    keys: Tuple[int, ...]  # tie breakers high to low (numeric ranks 2..14)
+def pack_hand(s4, s2, s1):
+    """Pack a partition's three Scores into one int64 (21-bit fields).
 
-    def tuple(self) -> Tuple[int, Tuple[int, ...]]:
-        return (self.cat, self.keys)
+    Works on ints or NumPy arrays; see _eval_numba.tally_packed.
+    """
+    return (s4 << 42) | (s2 << 21) | s1
 
-    def __lt__(self, other: "Score") -> bool:  # type: ignore[override]
-        return self.tuple() < other.tuple()
 
-    def __gt__(self, other: "Score") -> bool:  # type: ignore[override]
-        return self.tuple() > other.tuple()
+def unpack_score(score: Score) -> Tuple[int, Tuple[int, ...]]:
+    """Decode a Score back to (cat, keys), e.g. for display or debugging."""
+    keys = tuple(k for k in ((score >> 12) & 15, (score >> 8) & 15,
+                             (score >> 4) & 15, score & 15) if k)
+    return score >> 16, keys
 
 
 # Helpers
@@ -48,178 +62,121 @@ STRAIGHTS = [
     (5, 4, 3, 2),
 ]
 
-# Pre-compute frozensets for fast subset checks
-_STRAIGHT_SETS = [(frozenset(w), w) for w in STRAIGHTS]
+# Four cards form a straight only when their rank bitmask (bit v for rank v)
+# equals a window's mask exactly, so detection is one dict lookup
+STRAIGHT_BY_MASK: Dict[int, Tuple[int, ...]] = {
+    sum(1 << v for v in w): w for w in STRAIGHTS}
 
 
-def _is_straight(vals: List[int]) -> Tuple[bool, Tuple[int, ...]]:
-    s = frozenset(vals)
-    if len(s) < 4:
+def _is_straight(vals: Sequence[int]) -> Tuple[bool, Tuple[int, ...]]:
+    m = 0
+    for v in vals:
+        m |= 1 << v
+    window = STRAIGHT_BY_MASK.get(m)
+    if window is None:
         return False, ()
-    for fset, window in _STRAIGHT_SETS:
-        if fset <= s:
-            return True, window
-    return False, ()
+    return True, window
 
 
 # ── Raw scoring functions (operate on value/suit tuples for speed) ────
 
-def _eval4_raw(vals: Tuple[int, ...], suits: Tuple[str, ...]) -> Tuple[int, Tuple[int, ...]]:
-    """Score a 4-card hand from raw vals and suits. Returns (cat, keys) tuple."""
+def _eval4_raw(vals: Tuple[int, ...], suits: Tuple[int, ...]) -> Score:
+    """Score a 4-card hand from raw vals and suits."""
     flush = (suits[0] == suits[1] == suits[2] == suits[3])
-    
-    vals_list = list(vals)
-    is_straight, seq = _is_straight(vals_list)
+    is_straight, seq = _is_straight(vals)
 
     if flush and is_straight:
-        return (CAT_SF, seq)
-
-    cnt = Counter(vals)
-    most = cnt.most_common(2)
-    if most[0][1] == 4:
-        return (CAT_FOUR, (most[0][0],))
+        return pack_score(CAT_SF, seq)
+
+    # Rank tally; keep the two most frequent ranks (higher rank on ties)
+    cnt = [0] * 15
+    for v in vals:
+        cnt[v] += 1
+    first_v = first_c = second_v = second_c = 0
+    for v in range(14, 1, -1):
+        c = cnt[v]
+        if c > first_c:
+            second_v, second_c = first_v, first_c
+            first_v, first_c = v, c
+        elif c > second_c:
+            second_v, second_c = v, c
+
+    if first_c == 4:
+        return pack_score(CAT_FOUR, (first_v,))
 
     if flush:
-        return (CAT_FLUSH, tuple(sorted(vals, reverse=True)))
+        return pack_score(CAT_FLUSH, tuple(sorted(vals, reverse=True)))
 
     if is_straight:
-        return (CAT_STRAIGHT, seq)
-
-    if most[0][1] == 3:
-        trip = most[0][0]
-        kicker = max(v for v in vals if v != trip)
-        return (CAT_TRIPS, (trip, kicker))
-
-    if most[0][1] == 2 and len(most) > 1 and most[1][1] == 2:
-        pair_hi = max(most[0][0], most[1][0])
-        pair_lo = min(most[0][0], most[1][0])
-        return (CAT_TWO_PAIR, (pair_hi, pair_lo))
-
-    if most[0][1] == 2:
-        pair = most[0][0]
-        kickers = sorted((v for v in vals if v != pair), reverse=True)
-        return (CAT_PAIR, (pair, *kickers))
-
-    return (CAT_HIGH, tuple(sorted(vals, reverse=True)))
-
-
-def _eval4_no_joker(cards: Sequence[Card]) -> Score:
-    vals = tuple(c.val for c in cards)
-    suits = tuple(c.suit for c in cards)
-    cat, keys = _eval4_raw(vals, suits)
-    return Score(cat, keys)
-
-
-def _materialize_with_joker(cards: Sequence[Card]) -> List[Tuple[Score, bool]]:
-    """Generate candidate scores replacing the Joker as allowed.
-
-    Optimized: instead of trying all 52 rank+suit combos, we target only
-    suits/ranks that could form a flush or straight, drastically reducing
-    evaluations.
-    """
-    from .cards import SUITS, Card as C
+        return pack_score(CAT_STRAIGHT, seq)
 
-    non_j = [c for c in cards if c.rank != JOKER]
-    non_j_vals = [c.val for c in non_j]
-    non_j_suits = [c.suit for c in non_j]
-    results: List[Tuple[Score, bool]] = []
+    if first_c == 3:
+        return pack_score(CAT_TRIPS, (first_v, second_v))
 
-    suit_counts = Counter(non_j_suits)
+    if first_c == 2 and second_c == 2:
+        # Scan is high to low, so first_v is the higher pair
+        return pack_score(CAT_TWO_PAIR, (first_v, second_v))
 
-    # ── Flush candidates: only try the suit that has 3 cards (needs 1 more) ──
-    flush_suits = [s for s, cnt in suit_counts.items() if cnt >= 3]
+    if first_c == 2:
+        kickers = sorted((v for v in vals if v != first_v), reverse=True)
+        return pack_score(CAT_PAIR, (first_v, *kickers))
 
-    for suit in flush_suits:
-        for val in range(2, 15):
-            repl = C(RANKS[val - 2], suit)
-            sc = _eval4_no_joker([*non_j, repl])
-            if sc.cat in (CAT_SF, CAT_FLUSH):
-                results.append((sc, True))
+    return pack_score(CAT_HIGH, tuple(sorted(vals, reverse=True)))
 
-    # ── Straight candidates: try ranks that could complete a straight ──
-    val_set = set(non_j_vals)
-    straight_ranks: set[int] = set()
-    for fset, window in _STRAIGHT_SETS:
-        present = sum(1 for v in window if v in val_set)
-        if present >= 3:
-            for v in window:
-                if v not in val_set:
-                    straight_ranks.add(v)
 
-    for val in straight_ranks:
-        for suit in SUITS:
-            repl = C(RANKS[val - 2], suit)
-            sc = _eval4_no_joker([*non_j, repl])
-            if sc.cat == CAT_STRAIGHT:
-                results.append((sc, True))
-                break
+# ── 4-card lookup table ───────────────────────────────────────
+# Every 4-card combo (Joker included) is scored once into SCORE4_LUT; see
+# _lut.py.  The Python list copy keeps per-hand lookups off NumPy scalars.
 
-    # ── Joker as Ace (default, any suit) ──
-    for suit in SUITS:
-        sc = _eval4_no_joker([*non_j, C("A", suit)])
-        results.append((sc, False))
+SCORE4_LUT = load_score4_lut(_eval4_raw)
+_SCORE4 = SCORE4_LUT.tolist()
 
-    return results
 
+# ── 2-card table by rank value ────────────────────────────────
+# A 2-card score depends only on the two values: the Joker (val 14) pairs an
+# Ace and otherwise plays as an Ace high, exactly like a real Ace, and suits
+# never matter.  _SCORE2_BY_VAL[v1][v2] is symmetric, so no sort is needed.
 
-# ── Cached scoring via frozenset keys ─────────────────────────
-# The key is a frozenset of (rank, suit) tuples which is order-independent
-# and hashable. Cache sizes are set larger than C(46,4) subsets encountered.
+def _score2_vals(v1: int, v2: int) -> Score:
+    if v1 == v2:
+        return pack_score(CAT_PAIR, (v1,))
+    return pack_score(CAT_HIGH, (max(v1, v2), min(v1, v2)))
 
-@lru_cache(maxsize=262144)
-def _cached_score4(key: frozenset) -> Score:
-    """Cached score4 keyed on frozenset of (rank, suit) tuples."""
-    cards = [Card(r, s) for r, s in key]
-    return _score4_impl(cards)
 
+_SCORE2_BY_VAL = [[_score2_vals(v1, v2) if v1 > 1 and v2 > 1 else 0
+                   for v2 in range(15)] for v1 in range(15)]
 
-@lru_cache(maxsize=16384)
-def _cached_score2(key: frozenset) -> Score:
-    cards = [Card(r, s) for r, s in key]
-    return _score2_impl(cards)
 
-
-@lru_cache(maxsize=4096)
-def _cached_score1(rank: str, suit: str | None) -> Score:
-    v = 14 if rank == JOKER else RANK_TO_VAL[rank]
-    return Score(CAT_HIGH, (v,))
-
-
-def _score4_impl(cards: Sequence[Card]) -> Score:
-    if any(c.rank == JOKER for c in cards):
-        cand = _materialize_with_joker(cards)
-        best = max(cand, key=lambda t: t[0])
-        return best[0]
-    else:
-        return _eval4_no_joker(cards)
+def score4(cards: Sequence[Card]) -> Score:
+    a, b, c, d = sorted([CARD_INDEX[x] for x in cards])
+    return _SCORE4[C1[a] + C2[b] + C3[c] + C4[d]]
 
 
-def _score2_impl(cards: Sequence[Card]) -> Score:
+def score2(cards: Sequence[Card]) -> Score:
     a, b = cards
-    vals = sorted([a.val, b.val], reverse=True)
-    if a.rank == JOKER or b.rank == JOKER:
-        other = b if a.rank == JOKER else a
-        if other.val == 14:
-            return Score(CAT_PAIR, (14,))
-        return Score(CAT_HIGH, (14, other.val))
-    if vals[0] == vals[1]:
-        return Score(CAT_PAIR, (vals[0],))
-    return Score(CAT_HIGH, (vals[0], vals[1]))
+    return _SCORE2_BY_VAL[a.val][b.val]
 
 
-def score4(cards: Sequence[Card]) -> Score:
-    key = frozenset((c.rank, c.suit) for c in cards)
-    return _cached_score4(key)
+def score1(cards: Sequence[Card]) -> Score:
+    return (CAT_HIGH << 16) | (cards[0].val << 12)
 
 
-def score2(cards: Sequence[Card]) -> Score:
-    key = frozenset((c.rank, c.suit) for c in cards)
-    return _cached_score2(key)
+# ── Packed tables for batch scoring ───────────────────────────
+# SCORE2_TABLE[i, j] / SCORE1_TABLE[i] give packed scores by card index, the
+# 2- and 1-card counterparts of SCORE4_LUT.
 
+_DECK = full_deck(include_joker=True)
+SCORE2_TABLE = np.array(
+    [[_SCORE2_BY_VAL[a.val][b.val] for b in _DECK] for a in _DECK],
+    dtype=SCORE4_LUT.dtype)
+SCORE1_TABLE = np.array(
+    [pack_score(CAT_HIGH, (c.val,)) for c in _DECK], dtype=SCORE4_LUT.dtype)
 
-def score1(cards: Sequence[Card]) -> Score:
-    c = cards[0]
-    return _cached_score1(c.rank, c.suit)
+
+def score4_batch(idx4: np.ndarray) -> np.ndarray:
+    """Packed scores for an (N, 4) array of card indices, each row ascending."""
+    return SCORE4_LUT[BINOM[idx4[:, 0], 1] + BINOM[idx4[:, 1], 2]
+                      + BINOM[idx4[:, 2], 3] + BINOM[idx4[:, 3], 4]]
 
 
 def compare_scores(a: Score, b: Score) -> int:
@@ -232,29 +189,10 @@ def compare_scores(a: Score, b: Score) -> int:
 
 
 def clear_score_caches():
-    """Clear all scoring LRU caches (call between simulation runs if needed)."""
-    _cached_score4.cache_clear()
-    _cached_score2.cache_clear()
-    _cached_score1.cache_clear()
-
-
-# ── NumPy int64 encoding for vectorized simulation ────────────
-# Each Score (cat, keys) is encoded into a single int64 using base-15
-# positional weighting.  All rank values are 0–14, so base 15 is safe.
-# The fixed-width representation is [cat, key0, key1, key2, key3, key4]
-# padded with zeros so that lexicographic tuple comparison and integer
-# comparison produce identical orderings.
-
-_POW = (759375, 50625, 3375, 225, 15, 1)  # 15**5 .. 15**0
-
-
-def score_to_int(score: Score) -> int:
-    """Encode a Score as a single int64 for fast NumPy comparison.
+    """Clear scoring memos between runs.
 
-    The encoding preserves lexicographic ordering: for any two Scores a, b,
-    ``a.tuple() > b.tuple()`` iff ``score_to_int(a) > score_to_int(b)``.
+    Hand scores are table lookups with nothing to clear; the only memo left
+    is house_way's dealer House Way cache, see clear_dealer_cache.
     """
-    result = score.cat * 759375  # cat * 15**5
-    for i, k in enumerate(score.keys):
-        result += k * _POW[i + 1]
-    return result
+    from .house_way import clear_dealer_cache  # lazy: house_way imports ranks
+    clear_dealer_cache()
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import atexit
+import multiprocessing
 import os
 import random
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from typing import Callable, List, Sequence, Tuple
 
 import numpy as np
 
-from .cards import Card, remaining_deck
+from .cards import CARD_INDEX, Card, remaining_deck
 from .partition import RankedPartition, all_ranked_non_foul
-from .house_way import set_dealer_421
-from .ranks import Score, score_to_int
+from .house_way import dealer_scores_421, dealer_scores_batch
+from ._eval_numba import HAVE_NUMBA, N_CARDS, tally_packed
+from .ranks import Score, pack_hand
 
 # ── Configuration ─────────────────────────────────────────────
 # Number of worker processes.  Override with ASIA_POKER_WORKERS env var.
@@ -21,6 +26,26 @@ _WORKERS = int(os.environ.get("ASIA_POKER_WORKERS", _MAX_WORKERS))
 # Minimum samples before we bother spawning subprocesses
 _MP_THRESHOLD = 2000
 
+# Chunks queued per worker: more, smaller chunks give finer progress and
+# cancellation and balance uneven workers, at a small per-chunk IPC cost
+_CHUNKS_PER_WORKER = 4
+
+# Seconds between progress/cancel polls while waiting on worker chunks
+_POLL_INTERVAL = 0.05
+
+# Dtype of the unpacked score columns compared by _tally_batch.  Scores are
+# below 2**19, so the NumPy fallback compares int32 (~1.5x faster than
+# int64); the Numba SWAR path packs the columns with pack_hand, which needs
+# int64.
+_SCORE_DTYPE = np.int64 if HAVE_NUMBA else np.int32
+
+# Batch size for vectorized comparison — accumulate this many dealer hands
+# before comparing against all player partitions in one NumPy operation.
+# Shared by _sim_chunk and _simulate_single_numpy.  A P-adaptive size
+# (65536 // P, clamped to 128..2000) measured no faster: with Numba, 500 was
+# as fast or faster for P = 42..79, and without it the dealer loop dominates.
+_BATCH = 500
+
 # Set ASIA_POKER_NO_NUMPY=1 to fall back to pure-Python loops (debug only)
 _USE_NUMPY = not bool(int(os.environ.get("ASIA_POKER_NO_NUMPY", "0")))
 
@@ -38,13 +63,141 @@ class SimResult:
         return (self.wins / n) if n else 0.0
 
 
+def _ranked_results(parts: Sequence[RankedPartition], W, L, P) -> Tuple[SimResult, List[SimResult]]:
+    """(best, all results sorted by win rate desc) from per-partition tallies.
+
+    Every partition is scored against the same dealer hands, so W + L + P is
+    equal across partitions and win-rate order is just wins order: one stable
+    argsort on W, ties kept in partition order as the old key sort did.
+    """
+    order = np.argsort(-np.asarray(W, dtype=np.int64), kind="stable").tolist()
+    results = [SimResult(rp=parts[i], wins=int(W[i]), losses=int(L[i]), pushes=int(P[i]))
+               for i in order]
+    return results[0], results
+
+
+# ══════════════════════════════════════════════════════════════
+#  Vectorized dealer draws and batch comparison (NumPy paths)
+# ══════════════════════════════════════════════════════════════
+
+def _draw_batch(gen: np.random.Generator, deck_idx: np.ndarray, out: np.ndarray) -> None:
+    """Fill *out* (B, 7) with B independent 7-card draws from *deck_idx*.
+
+    Batched partial Fisher–Yates: seven column swaps over a (B, n) copy of
+    the deck, each with B random positions drawn in one NumPy call.
+    """
+    B = len(out)
+    n = len(deck_idx)
+    pool = np.tile(deck_idx, (B, 1))
+    rows = np.arange(B)
+    for k in range(out.shape[1]):
+        j = gen.integers(k, n, size=B)
+        picked = pool[rows, j]
+        pool[rows, j] = pool[:, k]
+        out[:, k] = picked
+
+
+def _tally_buffers(n_parts: int, batch: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(P, batch) int8 win/loss tallies and bool mask, reused by _tally_batch."""
+    return (np.empty((n_parts, batch), dtype=np.int8),
+            np.empty((n_parts, batch), dtype=np.int8),
+            np.empty((n_parts, batch), dtype=np.bool_))
+
+
+def _tally_batch(
+    p4: np.ndarray, p2: np.ndarray, p1: np.ndarray, pk: np.ndarray,
+    d4: np.ndarray, d2: np.ndarray, d1: np.ndarray,
+    W: np.ndarray, L: np.ndarray, P: np.ndarray,
+    bufs: Tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Add each partition's wins/losses/pushes against a dealer batch.
+
+    With Numba the packed keys (*pk* = pack_hand(p4, p2, p1)) go through
+    tally_packed, one SWAR subtract per partition/dealer pair.  Otherwise:
+
+    Sub-hand wins and losses are counted into two (P, B) int8 tallies
+    through one reusable bool mask (every ufunc writes via out=, no bool
+    views or full-size temporaries); a hand is won or lost when its tally
+    reaches 2, and pushes are whatever remains of B.  *bufs* come from
+    _tally_buffers and are allocated once per run.
+
+    The (P, B) orientation is deliberate: each row reduction runs over the
+    contiguous batch axis, and a (B, P) layout measured no faster at P=300
+    and ~1.5x slower at small P.  Tiling P into L2-sized blocks was also
+    tried and measured 10-30% slower: at batch 500 the whole working set is
+    ~(P x 1.5) KB, already cache-resident for real hands, so tiling only
+    adds per-tile Python overhead.
+    """
+    if HAVE_NUMBA:
+        tally_packed(pk, pack_hand(d4, d2, d1), W, L, P)
+        return
+
+    B = len(d4)
+    wins, losses, mask = (buf[:, :B] for buf in bufs)  # views; last batch may be short
+    wins.fill(0)
+    losses.fill(0)
+    for p, d in ((p4, d4), (p2, d2), (p1, d1)):
+        pc = p[:, None]
+        dr = d[None, :]
+        np.greater(pc, dr, out=mask)
+        np.add(wins, mask, out=wins)
+        np.less(pc, dr, out=mask)
+        np.add(losses, mask, out=losses)
+    w = np.count_nonzero(np.greater_equal(wins, 2, out=mask), axis=1)
+    lo = np.count_nonzero(np.greater_equal(losses, 2, out=mask), axis=1)
+    W += w
+    L += lo
+    P += B - w - lo
+
+
 # ══════════════════════════════════════════════════════════════
 #  Top-level worker function (must be picklable for Windows spawn)
 # ══════════════════════════════════════════════════════════════
 
+def _deck_bytes(deck: Sequence[Card]) -> bytes:
+    """Encode *deck* for workers as one dense card index (0..52) per byte.
+
+    Workers index the score tables with these directly, so no Card objects
+    are rebuilt per chunk, and the payload pickles as a ~45-byte string.
+    """
+    return bytes(CARD_INDEX[c] for c in deck)
+
+
+# Shared (samples done, cancel flag) values, set in pool workers by
+# _warm_worker; None in the parent process
+_WORKER_SHARED = None
+
+
+def _warm_worker(shared=None) -> None:
+    """Pool initializer: load the tables and kernels once, before any chunk.
+
+    Importing ranks loads SCORE4_LUT from the cache directory, and a
+    one-sample chunk compiles (or loads from numba's cache) the kernels
+    _sim_chunk calls, so the first real chunk starts warm.  *shared* is the
+    pool's (samples done, cancel flag) pair, see _get_pool; it is set after
+    the warm-up so that sample is not counted.
+    """
+    global _WORKER_SHARED
+    from . import ranks  # noqa: F401
+    from . import house_way  # noqa: F401
+    if HAVE_NUMBA and _USE_NUMPY:
+        _sim_chunk(bytes(range(N_CARDS)), bytes(8), 1, 0)
+    _WORKER_SHARED = shared
+
+
+def _report_batch(n: int) -> bool:
+    """Add *n* finished samples to the pool's counter; True if cancelled."""
+    if _WORKER_SHARED is None:
+        return False
+    done, cancelled = _WORKER_SHARED
+    with done.get_lock():
+        done.value += n
+    return bool(cancelled.value)
+
+
 def _sim_chunk(
-    deck_cards: List[Tuple[str, str | None]],
-    player_ints_flat: List[List[int]],   # shape (P, 3) as nested list
+    deck_bytes: bytes,
+    player_bytes: bytes,
     chunk_size: int,
     seed: int,
 ) -> Tuple[List[int], List[int], List[int]]:
@@ -52,99 +205,80 @@ def _sim_chunk(
 
     Uses batched NumPy vectorized comparison of all player partitions
     against batches of dealer hands.  Arguments use plain Python types
-    for pickling on Windows (spawn).
+    for pickling on Windows (spawn); *deck_bytes* holds one card index per
+    byte (see _deck_bytes) and *player_bytes* one pack_hand int64 per
+    partition.
 
     Returns (W, L, P) lists of length P.
     """
     import numpy as _np
-    from .cards import Card as C
-    from .house_way import set_dealer_421 as _dealer_421
-    from .ranks import score_to_int as _s2i
+    from .house_way import dealer_scores_batch as _dealer_batch
 
-    _B = 500  # batch size
-
-    rng = random.Random(seed)
-    pi = _np.array(player_ints_flat, dtype=_np.int64)  # (P, 3)
-    p4, p2, p1 = pi[:, 0], pi[:, 1], pi[:, 2]         # each (P,)
-    n_parts = pi.shape[0]
+    gen = _np.random.default_rng(seed)
+    # Unpack to three contiguous (P,) columns for the NumPy compare
+    pk = _np.frombuffer(player_bytes, dtype=_np.int64)
+    field = (1 << 21) - 1
+    p4 = (pk >> 42).astype(_SCORE_DTYPE)
+    p2 = ((pk >> 21) & field).astype(_SCORE_DTYPE)
+    p1 = (pk & field).astype(_SCORE_DTYPE)
+    n_parts = len(pk)
 
     W = _np.zeros(n_parts, dtype=_np.int64)
     L = _np.zeros(n_parts, dtype=_np.int64)
     P = _np.zeros(n_parts, dtype=_np.int64)
 
-    deck = [C(rank, suit) for rank, suit in deck_cards]
+    deck = _np.frombuffer(deck_bytes, dtype=_np.uint8).astype(_np.intp)
 
-    d4_buf = _np.empty(_B, dtype=_np.int64)
-    d2_buf = _np.empty(_B, dtype=_np.int64)
-    d1_buf = _np.empty(_B, dtype=_np.int64)
+    d4_buf = _np.empty(_BATCH, dtype=_SCORE_DTYPE)
+    d2_buf = _np.empty(_BATCH, dtype=_SCORE_DTYPE)
+    d1_buf = _np.empty(_BATCH, dtype=_SCORE_DTYPE)
+    picks = _np.empty((_BATCH, 7), dtype=_np.intp)
+    bufs = _tally_buffers(n_parts, _BATCH)
 
-    for batch_start in range(0, chunk_size, _B):
-        B = min(_B, chunk_size - batch_start)
-
-        for j in range(B):
-            dealer7 = rng.sample(deck, 7)
-            dealer = _dealer_421(dealer7)
-            d4_buf[j] = _s2i(dealer.s4)
-            d2_buf[j] = _s2i(dealer.s2)
-            d1_buf[j] = _s2i(dealer.s1)
+    for batch_start in range(0, chunk_size, _BATCH):
+        B = min(_BATCH, chunk_size - batch_start)
 
+        _draw_batch(gen, deck, picks[:B])
         d4 = d4_buf[:B]
         d2 = d2_buf[:B]
         d1 = d1_buf[:B]
+        _dealer_batch(picks[:B], d4, d2, d1)
 
-        w4 = p4[:, None] > d4[None, :]
-        w2 = p2[:, None] > d2[None, :]
-        w1 = p1[:, None] > d1[None, :]
-
-        l4 = p4[:, None] < d4[None, :]
-        l2 = p2[:, None] < d2[None, :]
-        l1 = p1[:, None] < d1[None, :]
-
-        sub_wins = w4.view(_np.uint8) + w2.view(_np.uint8) + w1.view(_np.uint8)
-        sub_losses = l4.view(_np.uint8) + l2.view(_np.uint8) + l1.view(_np.uint8)
-
-        w_flag = sub_wins >= 2
-        l_flag = sub_losses >= 2
-
-        W += w_flag.sum(axis=1)
-        L += l_flag.sum(axis=1)
-        P += (~(w_flag | l_flag)).sum(axis=1)
+        _tally_batch(p4, p2, p1, pk, d4, d2, d1, W, L, P, bufs)
+        if _report_batch(B):
+            break
 
     return W.tolist(), L.tolist(), P.tolist()
 
 
 def _sim_chunk_pure(
-    deck_cards: List[Tuple[str, str | None]],
-    part_score_tuples: List[Tuple[
-        Tuple[int, Tuple[int, ...]],
-        Tuple[int, Tuple[int, ...]],
-        Tuple[int, Tuple[int, ...]],
-    ]],
+    deck_bytes: bytes,
+    part_scores: Sequence[Tuple[int, int, int]],
     chunk_size: int,
     seed: int,
 ) -> Tuple[List[int], List[int], List[int]]:
-    """Pure-Python fallback for _sim_chunk (no NumPy)."""
-    from .cards import Card as C
-    from .house_way import set_dealer_421 as _dealer_421
+    """Pure-Python fallback for _sim_chunk (no NumPy).
+
+    *part_scores* holds each partition's packed (s4, s2, s1) scores.
+    """
+    from .house_way import dealer_scores_421 as _dealer_421
 
     rng = random.Random(seed)
-    n_parts = len(part_score_tuples)
+    n_parts = len(part_scores)
 
     W = [0] * n_parts
     L = [0] * n_parts
     P = [0] * n_parts
 
-    deck = [C(rank, suit) for rank, suit in deck_cards]
+    deck = list(deck_bytes)
 
-    for _ in range(chunk_size):
-        dealer7 = rng.sample(deck, 7)
-        dealer = _dealer_421(dealer7)
-        ds4 = dealer.s4.tuple()
-        ds2 = dealer.s2.tuple()
-        ds1 = dealer.s1.tuple()
+    for i in range(chunk_size):
+        if i and i % _BATCH == 0 and _report_batch(_BATCH):
+            break
+        ds4, ds2, ds1 = _dealer_421(rng.sample(deck, 7))
 
         for idx in range(n_parts):
-            ps4, ps2, ps1 = part_score_tuples[idx]
+            ps4, ps2, ps1 = part_scores[idx]
             ww = 0
             ll = 0
             if ps4 > ds4:
@@ -170,6 +304,57 @@ def _sim_chunk_pure(
     return W, L, P
 
 
+# ══════════════════════════════════════════════════════════════
+#  Persistent worker pool
+# ══════════════════════════════════════════════════════════════
+# Created on first use and kept for the life of the process, so repeated
+# simulate_best calls (e.g. every Recommend click) skip worker start-up and
+# table loading.  Recreated if a different size is requested or it breaks.
+# Workers add finished samples to a shared counter after every batch, so the
+# parent can report progress (and stop them on cancel) between chunks.
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_SIZE = 0
+_POOL_SHARED = None
+_POOL_LOCK = threading.Lock()
+# Chunks of a cancelled run that were already running.  They stop at their
+# next batch; the next run waits for them before resetting the shared
+# counter and flag, so they neither outlive the cancel nor count as its
+# progress.
+_STALE_FUTURES: set = set()
+
+
+def _get_pool(workers: int):
+    """Return (pool, (samples done, cancel flag)) with *workers* processes."""
+    global _POOL, _POOL_SIZE, _POOL_SHARED
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_SIZE != workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            _STALE_FUTURES.clear()  # they report to the old pool's counter
+            _POOL_SHARED = (multiprocessing.Value("q", 0),
+                            multiprocessing.Value("b", 0, lock=False))
+            _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker,
+                                        initargs=(_POOL_SHARED,))
+            _POOL_SIZE = workers
+        return _POOL, _POOL_SHARED
+
+
+def shutdown_pool() -> None:
+    """Stop the persistent worker pool (also runs at interpreter exit)."""
+    global _POOL, _POOL_SIZE, _POOL_SHARED
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False)
+        _POOL = None
+        _POOL_SIZE = 0
+        _POOL_SHARED = None
+        _STALE_FUTURES.clear()
+
+
+atexit.register(shutdown_pool)
+
+
 # ══════════════════════════════════════════════════════════════
 #  Public API
 # ══════════════════════════════════════════════════════════════
@@ -180,10 +365,12 @@ def simulate_best(
     seed: int | None = None,
     progress: Callable[[float], None] | None = None,
     cancel: Callable[[], bool] | None = None,
+    n_workers: int | None = None,
 ) -> Tuple[SimResult, List[SimResult]]:
     """Monte Carlo estimate of the best 4-2-1 against dealer House Way.
 
-    Uses multiprocessing when *samples* >= _MP_THRESHOLD and _WORKERS > 1.
+    Uses multiprocessing when *samples* >= _MP_THRESHOLD and more than one
+    worker is allowed (*n_workers*, default _WORKERS).
     Inner partition comparison is vectorized via NumPy int64 encoding
     unless ASIA_POKER_NO_NUMPY=1 is set.
 
@@ -200,7 +387,8 @@ def simulate_best(
     n = samples
     num_parts = len(parts)
 
-    use_mp = _WORKERS > 1 and n >= _MP_THRESHOLD
+    max_workers = _WORKERS if n_workers is None else max(1, n_workers)
+    use_mp = max_workers > 1 and n >= _MP_THRESHOLD
 
     if not use_mp:
         if _USE_NUMPY:
@@ -208,29 +396,30 @@ def simulate_best(
         return _simulate_single_pure(parts, deck, n, rng, progress, cancel)
 
     # ── Multi-process path ────────────────────────────────────
-    deck_cards = [(c.rank, c.suit) for c in deck]
+    deck_bytes = _deck_bytes(deck)
 
     # Choose chunk function and data format based on numpy availability
     if _USE_NUMPY:
-        player_ints_flat = [
-            [score_to_int(rp.s4), score_to_int(rp.s2), score_to_int(rp.s1)]
-            for rp in parts
-        ]
+        # One packed int64 per partition: a single small bytes object to pickle
+        payload = np.array([pack_hand(rp.s4, rp.s2, rp.s1) for rp in parts],
+                           dtype=np.int64).tobytes()
         chunk_fn = _sim_chunk
     else:
-        part_score_tuples = [
-            (rp.s4.tuple(), rp.s2.tuple(), rp.s1.tuple())
+        payload = [
+            (rp.s4, rp.s2, rp.s1)
             for rp in parts
         ]
         chunk_fn = _sim_chunk_pure
 
-    # Give each worker one large chunk (= samples / workers)
-    workers = min(_WORKERS, max(1, n // _MP_THRESHOLD))
-    base = n // workers
-    remainder = n % workers
+    # Split samples into _CHUNKS_PER_WORKER chunks per worker; each chunk
+    # gets its own seed and reports progress when it completes
+    workers = min(max_workers, max(1, n // _MP_THRESHOLD))
+    n_chunks = min(workers * _CHUNKS_PER_WORKER, max(1, n // (_MP_THRESHOLD // 4)))
+    base = n // n_chunks
+    remainder = n % n_chunks
 
     chunks: List[Tuple[int, int]] = []
-    for w in range(workers):
+    for w in range(n_chunks):
         cs = base + (1 if w < remainder else 0)
         chunks.append((cs, rng.randint(0, 2**63)))
 
@@ -240,50 +429,54 @@ def simulate_best(
     completed_samples = 0
 
     try:
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {}
-            for cs, s in chunks:
-                payload = player_ints_flat if _USE_NUMPY else part_score_tuples
-                fut = executor.submit(chunk_fn, deck_cards, payload, cs, s)
-                futures[fut] = cs
-
-            for fut in as_completed(futures):
-                if cancel and cancel():
-                    for f in futures:
-                        f.cancel()
-                    break
+        executor, (done, cancelled) = _get_pool(max_workers)
+        if _STALE_FUTURES:
+            wait(_STALE_FUTURES)
+            _STALE_FUTURES.clear()
+        done.value = 0
+        cancelled.value = 0
+        futures = {}
+        for cs, s in chunks:
+            fut = executor.submit(chunk_fn, deck_bytes, payload, cs, s)
+            futures[fut] = cs
+
+        pending = set(futures)
+        reported = 0
+        while pending:
+            finished, pending = wait(pending, timeout=_POLL_INTERVAL,
+                                     return_when=FIRST_COMPLETED)
+            if cancel and cancel():
+                # Drop queued chunks; running ones stop after their batch
+                cancelled.value = 1
+                _STALE_FUTURES.update(f for f in pending if not f.cancel())
+                break
 
+            for fut in finished:
                 cw, cl, cp = fut.result()
-                cs = futures[fut]
                 for idx in range(num_parts):
                     W[idx] += cw[idx]
                     L[idx] += cl[idx]
                     P[idx] += cp[idx]
-                completed_samples += cs
+                completed_samples += futures[fut]
 
-                if progress:
-                    progress(completed_samples / n)
+            # Per-batch worker count; never behind finished chunks
+            current = max(completed_samples, min(done.value, n))
+            if progress and current > reported:
+                reported = current
+                progress(current / n)
 
-    except (BrokenPipeError, OSError):
+    except (BrokenPipeError, BrokenProcessPool, OSError):
+        shutdown_pool()
         if _USE_NUMPY:
             return _simulate_single_numpy(parts, deck, n, rng, progress, cancel)
         return _simulate_single_pure(parts, deck, n, rng, progress, cancel)
 
-    results: List[SimResult] = [
-        SimResult(rp=parts[i], wins=W[i], losses=L[i], pushes=P[i])
-        for i in range(num_parts)
-    ]
-    results.sort(key=lambda r: (r.win_rate, r.wins), reverse=True)
-    best = results[0]
+    best, results = _ranked_results(parts, W, L, P)
     if progress:
         progress(1.0)
     return best, results
 
 
-# Batch size for vectorized comparison — accumulate this many dealer hands
-# before comparing against all player partitions in one NumPy operation.
-_BATCH = 500
-
 
 def _simulate_single_numpy(
     parts: List[RankedPartition],
@@ -295,84 +488,54 @@ def _simulate_single_numpy(
 ) -> Tuple[SimResult, List[SimResult]]:
     """NumPy-vectorized single-process simulation loop.
 
-    Dealer hands are scored in Python (house-way logic is branchy), but the
-    comparison of all P player partitions against a *batch* of B dealer hands
-    is done in one vectorized operation: (P, 1) vs (1, B) broadcast per
-    sub-hand, giving a real speedup over the pure-Python inner loop.
+    Dealer hands are drawn and scored a batch of B at a time; the comparison
+    of all P player partitions against the batch is one vectorized
+    _tally_batch call over (P, B) broadcasts.
     """
     num_parts = len(parts)
 
-    # Pre-compute player score int64 columns — contiguous (P,) each
-    p4 = np.array([score_to_int(rp.s4) for rp in parts], dtype=np.int64)
-    p2 = np.array([score_to_int(rp.s2) for rp in parts], dtype=np.int64)
-    p1 = np.array([score_to_int(rp.s1) for rp in parts], dtype=np.int64)
+    # Pre-compute player score columns — contiguous (P,) each
+    p4 = np.array([rp.s4 for rp in parts], dtype=_SCORE_DTYPE)
+    p2 = np.array([rp.s2 for rp in parts], dtype=_SCORE_DTYPE)
+    p1 = np.array([rp.s1 for rp in parts], dtype=_SCORE_DTYPE)
+    pk = np.array([pack_hand(rp.s4, rp.s2, rp.s1) for rp in parts], dtype=np.int64)
+    deck_idx = np.array([CARD_INDEX[c] for c in deck], dtype=np.intp)
+    gen = np.random.default_rng(rng.getrandbits(64))
 
     W = np.zeros(num_parts, dtype=np.int64)
     L = np.zeros(num_parts, dtype=np.int64)
     P = np.zeros(num_parts, dtype=np.int64)
 
     completed = 0
-    cancelled = False
 
-    # Pre-allocate dealer batch buffer
-    d4_buf = np.empty(_BATCH, dtype=np.int64)
-    d2_buf = np.empty(_BATCH, dtype=np.int64)
-    d1_buf = np.empty(_BATCH, dtype=np.int64)
+    # Pre-allocate dealer batch buffers
+    d4_buf = np.empty(_BATCH, dtype=_SCORE_DTYPE)
+    d2_buf = np.empty(_BATCH, dtype=_SCORE_DTYPE)
+    d1_buf = np.empty(_BATCH, dtype=_SCORE_DTYPE)
+    picks = np.empty((_BATCH, 7), dtype=np.intp)
+    bufs = _tally_buffers(num_parts, _BATCH)
 
     for batch_start in range(0, n, _BATCH):
-        if cancelled:
+        if cancel and cancel():
             break
         B = min(_BATCH, n - batch_start)
 
-        # Fill dealer batch (Python loop — house-way is branchy)
-        for j in range(B):
-            if cancel and cancel():
-                cancelled = True
-                B = j  # only use hands scored so far
-                break
-            dealer7 = rng.sample(deck, 7)
-            dealer = set_dealer_421(dealer7)
-            d4_buf[j] = score_to_int(dealer.s4)
-            d2_buf[j] = score_to_int(dealer.s2)
-            d1_buf[j] = score_to_int(dealer.s1)
-
-        if B == 0:
-            break
+        # Draw the dealer batch, then score it in one call
+        _draw_batch(gen, deck_idx, picks[:B])
 
         # Slices for this batch
         d4 = d4_buf[:B]
         d2 = d2_buf[:B]
         d1 = d1_buf[:B]
+        dealer_scores_batch(picks[:B], d4, d2, d1)
 
-        # Vectorized comparison: (P, 1) vs (1, B) -> (P, B) per sub-hand
-        w4 = p4[:, None] > d4[None, :]  # (P, B) bool
-        w2 = p2[:, None] > d2[None, :]
-        w1 = p1[:, None] > d1[None, :]
-
-        l4 = p4[:, None] < d4[None, :]
-        l2 = p2[:, None] < d2[None, :]
-        l1 = p1[:, None] < d1[None, :]
-
-        sub_wins = w4.view(np.uint8) + w2.view(np.uint8) + w1.view(np.uint8)    # (P, B)
-        sub_losses = l4.view(np.uint8) + l2.view(np.uint8) + l1.view(np.uint8)  # (P, B)
-
-        w_flag = sub_wins >= 2  # (P, B)
-        l_flag = sub_losses >= 2
-
-        W += w_flag.sum(axis=1)
-        L += l_flag.sum(axis=1)
-        P += (~(w_flag | l_flag)).sum(axis=1)
+        _tally_batch(p4, p2, p1, pk, d4, d2, d1, W, L, P, bufs)
 
         completed += B
         if progress:
             progress(completed / n)
 
-    results: List[SimResult] = [
-        SimResult(rp=parts[i], wins=int(W[i]), losses=int(L[i]), pushes=int(P[i]))
-        for i in range(num_parts)
-    ]
-    results.sort(key=lambda r: (r.win_rate, r.wins), reverse=True)
-    best = results[0]
+    best, results = _ranked_results(parts, W, L, P)
     if progress:
         progress(1.0)
     return best, results
@@ -393,20 +556,17 @@ def _simulate_single_pure(
     P = [0] * num_parts
 
     p_scores = [
-        (rp.s4.tuple(), rp.s2.tuple(), rp.s1.tuple())
+        (rp.s4, rp.s2, rp.s1)
         for rp in parts
     ]
+    deck_idx = [CARD_INDEX[c] for c in deck]
 
     report_every = max(1, n // 100)
 
     for i in range(n):
         if cancel and cancel():
             break
-        dealer7 = rng.sample(deck, 7)
-        dealer = set_dealer_421(dealer7)
-        ds4 = dealer.s4.tuple()
-        ds2 = dealer.s2.tuple()
-        ds1 = dealer.s1.tuple()
+        ds4, ds2, ds1 = dealer_scores_421(rng.sample(deck_idx, 7))
 
         for idx in range(num_parts):
             ps4, ps2, ps1 = p_scores[idx]
@@ -435,12 +595,7 @@ def _simulate_single_pure(
         if progress and (i + 1) % report_every == 0:
             progress((i + 1) / n)
 
-    results: List[SimResult] = [
-        SimResult(rp=parts[i], wins=W[i], losses=L[i], pushes=P[i])
-        for i in range(num_parts)
-    ]
-    results.sort(key=lambda r: (r.win_rate, r.wins), reverse=True)
-    best = results[0]
+    best, results = _ranked_results(parts, W, L, P)
     if progress:
         progress(1.0)
     return best, results
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple
 
 from PySide6.QtCore import Qt, QRect
-from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPixmap
 
 from ..core.cards import Card, SUITS, RANKS, JOKER, png_name
 from ..utils.resources import get_assets_dir
@@ -21,28 +23,52 @@ SUIT_COLOR = {
 }
 SUIT_GLYPH = {"S": "♠", "H": "♥", "D": "♦", "C": "♣"}
 
+# Fonts used by _render_card, built on first render (needs the QApplication)
+_FONTS: Dict[str, QFont] = {}
+
+
+def _fonts() -> Dict[str, QFont]:
+    if not _FONTS:
+        _FONTS.update(
+            joker=QFont("Segoe UI", 24, QFont.Weight.Bold),
+            rank=QFont("Segoe UI", 18, QFont.Weight.Bold),
+            corner=QFont("Segoe UI Symbol", 18),
+            center=QFont("Segoe UI Symbol", 60),
+        )
+    return _FONTS
+
 
 def ensure_assets() -> None:
     os.makedirs(ASSETS_DIR, exist_ok=True)
-    # Generate 53 PNGs if missing
-    for s in SUITS:
-        for r in RANKS:
-            _ensure_one(Card(r, s))
-    _ensure_one(Card(JOKER, None))
+    # Load all 53 PNGs, generating any that are missing or invalid.  Each card
+    # is independent and QImage decoding, painting and PNG encoding are safe
+    # off the GUI thread, so do them in parallel.  The decoded images are
+    # kept, so card_pixmap never reads a PNG again.
+    cards = [Card(r, s) for s in SUITS for r in RANKS] + [Card(JOKER, None)]
+    _fonts()  # build once on this thread; workers only read them
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        images = list(ex.map(_ensure_one, cards))
+    _IMAGE_CACHE.update((c.id(), img) for c, img in zip(cards, images))
+
 
+def _is_valid(img: QImage) -> bool:
+    return not img.isNull() and img.width() == CARD_W and img.height() == CARD_H
 
-def _ensure_one(card: Card) -> None:
-    path = os.path.join(ASSETS_DIR, png_name(card))
+
+def _ensure_one(card: Card) -> QImage:
+    path = asset_path(card)
     if os.path.exists(path):
-        existing = QImage(path)
-        if not existing.isNull() and existing.width() == CARD_W and existing.height() == CARD_H:
-            return
+        img = QImage(path)
+        if _is_valid(img):
+            return img
     img = _render_card(card)
     img.save(path)
+    return img
 
 
 def _render_card(card: Card) -> QImage:
     img = QImage(CARD_W, CARD_H, QImage.Format.Format_ARGB32_Premultiplied)
+    fonts = _fonts()
     painter = QPainter(img)
     painter.fillRect(0, 0, CARD_W, CARD_H, QColor(245, 245, 245))
     pen = QPen(QColor(30, 30, 30))
@@ -52,24 +78,54 @@ def _render_card(card: Card) -> QImage:
 
     if card.rank == JOKER:
         painter.setPen(QPen(QColor(40, 40, 120)))
-        font = QFont("Segoe UI", 24, QFont.Weight.Bold)
-        painter.setFont(font)
+        painter.setFont(fonts["joker"])
         painter.drawText(QRect(0, 40, CARD_W, 60), Qt.AlignmentFlag.AlignCenter, "JOKER")
     else:
         # Corner rank and suit
         color = SUIT_COLOR[card.suit]  # type: ignore[index]
         painter.setPen(QPen(color))
-        painter.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        painter.setFont(fonts["rank"])
         painter.drawText(8, 24, card.rank)
-        painter.setFont(QFont("Segoe UI Symbol", 18))
+        painter.setFont(fonts["corner"])
         painter.drawText(8, 44, SUIT_GLYPH[card.suit])  # type: ignore[index]
         # Center glyph
-        painter.setFont(QFont("Segoe UI Symbol", 60))
+        painter.setFont(fonts["center"])
         painter.drawText(QRect(0, 40, CARD_W, 90), Qt.AlignmentFlag.AlignCenter, SUIT_GLYPH[card.suit])  # type: ignore[index]
 
     painter.end()
     return img
 
 
+@functools.lru_cache(maxsize=64)
 def asset_path(card: Card) -> str:
+    # Cards are interned and hash by identity, so this is one lookup per card
     return os.path.join(ASSETS_DIR, png_name(card))
+
+
+# Card images decoded by ensure_assets, by card id.  QPixmap must be built
+# on the GUI thread, so conversion happens on first use in card_pixmap.
+_IMAGE_CACHE: Dict[str, QImage] = {}
+
+# Decoded card pixmaps by card id.  QPixmap is implicitly shared, so every
+# label showing a card reuses one decode of its PNG.
+_PIXMAP_CACHE: Dict[str, QPixmap] = {}
+
+
+def card_pixmap(card: Card) -> QPixmap:
+    k = card.id()
+    pix = _PIXMAP_CACHE.get(k)
+    if pix is None:
+        img = _IMAGE_CACHE.pop(k, None)
+        pix = QPixmap.fromImage(img) if img is not None else QPixmap(asset_path(card))
+        _PIXMAP_CACHE[k] = pix
+    return pix
+
+
+@functools.lru_cache(maxsize=256)
+def scaled_card_pixmap(card: Card, w: int, h: int) -> QPixmap:
+    """card_pixmap smooth-scaled to fit (w, h), memoized per card and size."""
+    return card_pixmap(card).scaled(
+        w, h,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
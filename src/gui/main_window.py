@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import math
 import os
 from typing import List, Optional
 
-from PySide6.QtCore import Qt, QSettings, QSize, QThread, QTimer
+from PySide6.QtCore import Qt, QMetaObject, QSettings, QSize, QThread, QTimer, Slot
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -49,6 +50,7 @@ _ASPECT = _DESIGN_W / _DESIGN_H
 _DEFAULT_WIDTH = 1600
 _MIN_SCALE = 0.25
 _MAX_SCALE = 2.0
+_SCALE_STEP = 0.05
 
 
 class MainWindow(QMainWindow):
@@ -65,7 +67,7 @@ class MainWindow(QMainWindow):
         # Timer to debounce scale updates during resize
         self._scale_update_timer = QTimer()
         self._scale_update_timer.setSingleShot(True)
-        self._scale_update_timer.setInterval(10)
+        self._scale_update_timer.setInterval(50)
         self._scale_update_timer.timeout.connect(self._apply_scale)
         
         # Timer to enforce aspect ratio only AFTER resize completes
@@ -80,9 +82,16 @@ class MainWindow(QMainWindow):
 
         # State
         self.selected: List[Card] = []
+        # One worker thread serves every run; self.thread is set only while
+        # a simulation is in flight
+        self._sim_thread = QThread(self)
+        QApplication.instance().aboutToQuit.connect(self._stop_sim_thread)
         self.thread: QThread | None = None
         self.worker: SimWorker | None = None
         self._hw_partition: RankedPartition | None = None  # Stored House Way partition
+        self._last_refresh_key: tuple | None = None  # see refresh_ui
+        self._left_panel_w = 0  # target grid width, set with the splitter sizes
+        self._split_total = 0  # splitter width those sizes were set for
 
         # ── Build UI ────────────────────────────────────────────
         central = QWidget()
@@ -123,8 +132,7 @@ class MainWindow(QMainWindow):
         controls.addWidget(QLabel("Samples"))
         controls.addWidget(self.samples)
         self.lbl_samples = QLabel(str(self.samples.value()))
-        self.samples.valueChanged.connect(
-            lambda val: self.lbl_samples.setText(str(val)))
+        self.samples.valueChanged.connect(self._on_samples_changed)
         controls.addWidget(self.lbl_samples)
 
         self.btn_new = QPushButton("New Hand")
@@ -173,17 +181,22 @@ class MainWindow(QMainWindow):
         total = self.splitter.width()
         left = int(total * _LEFT_FRAC)
         self.splitter.setSizes([left, total - left])
+        self._left_panel_w = left
+        self._split_total = total
         # Lock splitter: make it non-interactive so aspect ratio stays clean
         self.splitter.setHandleWidth(0)
         self._apply_scale()
 
     # ── Scaling ─────────────────────────────────────────────
 
+    @Slot()
     def _apply_scale(self):
         """Compute scale from left panel width / grid natural width."""
-        left_w = self.splitter.sizes()[0] if self.splitter.sizes() else int(
-            self.width() * _LEFT_FRAC)
+        left_w = self._left_panel_w or int(self.width() * _LEFT_FRAC)
         scale = left_w / _GRID_NAT_W
+        # Snap down to _SCALE_STEP so a drag visits few distinct sizes (hits in
+        # Qt's per-size icon pixmap cache) and never outgrows the pane
+        scale = math.floor(scale / _SCALE_STEP + 1e-9) * _SCALE_STEP
         scale = max(_MIN_SCALE, min(_MAX_SCALE, scale))
 
         if abs(scale - self._scale) < 0.005:
@@ -196,6 +209,12 @@ class MainWindow(QMainWindow):
     # ── UI helpers ──────────────────────────────────────────
 
     def refresh_ui(self):
+        # Everything below depends only on the selection and whether a
+        # simulation is running; skip the child updates if neither changed
+        key = (tuple(c.id() for c in self.selected), self.thread is not None)
+        if key == self._last_refresh_key:
+            return
+        self._last_refresh_key = key
         slots = self.selected + [None] * (7 - len(self.selected))
         self.status_bar.set_cards(slots)
         self.selector.set_disabled([c.id() for c in self.selected])
@@ -236,6 +255,11 @@ class MainWindow(QMainWindow):
             self.refresh_ui()
             self._show_house_way_if_needed()
 
+    @Slot(int)
+    def _on_samples_changed(self, val: int):
+        self.lbl_samples.setText(str(val))
+
+    @Slot()
     def on_new_hand(self):
         if self.thread:
             return
@@ -246,6 +270,7 @@ class MainWindow(QMainWindow):
 
     # ── Simulation ─────────────────────────────────────────
 
+    @Slot()
     def on_recommend(self):
         if len(self.selected) != 7 or self.thread:
             return
@@ -253,7 +278,10 @@ class MainWindow(QMainWindow):
         self.results.clear_sim_results()
         self.settings.setValue("samples", int(self.samples.value()))
 
-        self.thread = QThread()
+        if not self._sim_thread.isRunning():
+            # Below the GUI thread, so in-process simulations yield to it
+            self._sim_thread.start(QThread.Priority.LowPriority)
+        self.thread = self._sim_thread
         self.worker = SimWorker(
             self.selected, samples=int(self.samples.value()))
         self.worker.moveToThread(self.thread)
@@ -261,32 +289,37 @@ class MainWindow(QMainWindow):
         self.worker.finished.connect(self.on_sim_finished)
         self.worker.canceled.connect(self.on_sim_canceled)
         self.worker.error.connect(self.on_sim_error)
-        self.thread.started.connect(self.worker.run)
-        self.thread.finished.connect(self.thread.deleteLater)
 
         self.progress.setVisible(True)
         self.progress.setValue(0)
         self.btn_cancel.setEnabled(True)
         self.refresh_ui()
-        self.thread.start()
+        QMetaObject.invokeMethod(
+            self.worker, "run", Qt.ConnectionType.QueuedConnection)
 
+    @Slot()
     def on_cancel(self):
         if self.worker:
             self.worker.cancel()
 
+    @Slot(float)
     def on_sim_progress(self, f: float):
-        self.progress.setValue(max(0, min(100, int(f * 100))))
+        v = max(0, min(100, int(f * 100)))
+        if v != self.progress.value():
+            self.progress.setValue(v)
 
     def _cleanup_thread(self):
         self.btn_cancel.setEnabled(False)
         self.progress.setVisible(False)
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
+        # The thread stays up for the next run; the worker is deleted from
+        # its own event loop once run() has returned
+        if self.worker:
+            self.worker.deleteLater()
         self.thread = None
         self.worker = None
         self.refresh_ui()
 
+    @Slot(object, object)
     def on_sim_finished(self, best, all_results):
         bp = best.rp
         
@@ -294,9 +327,9 @@ class MainWindow(QMainWindow):
         if self._hw_partition is not None:
             hw = self._hw_partition
             # Compare partitions by comparing score tuples
-            if (bp.s4.tuple() == hw.s4.tuple() and
-                bp.s2.tuple() == hw.s2.tuple() and
-                bp.s1.tuple() == hw.s1.tuple()):
+            if (bp.s4 == hw.s4 and
+                bp.s2 == hw.s2 and
+                bp.s1 == hw.s1):
                 # Best matches House Way - update House Way widget with win rate
                 self.results.mark_house_way_as_best(best.win_rate)
             else:
@@ -317,9 +350,9 @@ class MainWindow(QMainWindow):
             # Skip if this alternative matches House Way
             if self._hw_partition is not None:
                 hw = self._hw_partition
-                if (rp.s4.tuple() == hw.s4.tuple() and
-                    rp.s2.tuple() == hw.s2.tuple() and
-                    rp.s1.tuple() == hw.s1.tuple()):
+                if (rp.s4 == hw.s4 and
+                    rp.s2 == hw.s2 and
+                    rp.s1 == hw.s1):
                     continue
             self.results.show_result(
                 "Alt", rp.hi, rp.mid, rp.low, alt.win_rate)
@@ -327,12 +360,17 @@ class MainWindow(QMainWindow):
         
         self._cleanup_thread()
 
+    @Slot()
     def on_sim_canceled(self):
         QMessageBox.information(self, "Canceled", "Simulation canceled")
         self._cleanup_thread()
 
-    def on_sim_error(self, msg: str):
-        QMessageBox.critical(self, "Error", msg)
+    @Slot(object, str)
+    def on_sim_error(self, exc: Exception, tb: str):
+        box = QMessageBox(QMessageBox.Icon.Critical, "Error", str(exc),
+                          QMessageBox.StandardButton.Ok, self)
+        box.setDetailedText(tb)  # behind "Show Details..."
+        box.exec()
         self._cleanup_thread()
 
     # ── Events ──────────────────────────────────────────────
@@ -340,9 +378,11 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):  # type: ignore[override]
         super().resizeEvent(event)
         
-        # Skip processing if this is our own programmatic resize
+        # Our own aspect correction: lay out for the new size, but don't
+        # schedule another correction
         if self._programmatic_resize:
             self._programmatic_resize = False
+            self._update_layout()
             return
         
         new_w = event.size().width()
@@ -359,6 +399,7 @@ class MainWindow(QMainWindow):
         # This means we only enforce aspect ratio 150ms after the user stops resizing
         self._aspect_correction_timer.start()
     
+    @Slot()
     def _enforce_aspect_ratio(self):
         """
         Enforce aspect ratio after resize completes (debounced).
@@ -370,6 +411,13 @@ class MainWindow(QMainWindow):
         if w <= 0 or h <= 0:
             return
         
+        # Use a tolerance to avoid unnecessary tiny corrections
+        TOLERANCE = 2
+        
+        # Already on ratio (width within tolerance, hence height too): done
+        if abs(w / h - _ASPECT) * h <= TOLERANCE:
+            return
+        
         # Calculate expected dimensions for aspect ratio
         expected_h = round(w / _ASPECT)
         expected_w = round(h * _ASPECT)
@@ -378,9 +426,6 @@ class MainWindow(QMainWindow):
         dw = abs(w - self.width())
         dh = abs(h - self.height())
         
-        # Use a tolerance to avoid unnecessary tiny corrections
-        TOLERANCE = 2
-        
         target_w, target_h = w, h
         needs_correction = False
         
@@ -401,18 +446,31 @@ class MainWindow(QMainWindow):
     
     def _update_layout(self):
         """Update splitter proportions and scale without triggering resize."""
-        # Update splitter proportions
+        # Update splitter proportions.  The grid's minimum width follows its
+        # fixed-size buttons, so stretch factors alone drift; setSizes is
+        # needed, but the handle is locked, so only when the width changes.
         total = self.splitter.width()
-        if total > 0:
+        if total > 0 and total != self._split_total:
             left = int(total * _LEFT_FRAC)
             self.splitter.setSizes([left, total - left])
+            self._left_panel_w = left
+            self._split_total = total
         
-        # Debounce scale updates using timer to avoid excessive recalculations
-        if not self._scale_update_timer.isActive():
-            self._scale_update_timer.start()
+        # Debounce scale updates: every resize restarts the timer, so a drag
+        # rescales the children once, when it pauses
+        self._scale_update_timer.start()
 
     def closeEvent(self, event):  # type: ignore[override]
         self.settings.setValue(
             "window_size", QSize(self.width(), self.height()))
+        self._stop_sim_thread()
         super().closeEvent(event)
 
+    @Slot()
+    def _stop_sim_thread(self):
+        # Cancel any run so the thread's event loop can exit, then join it
+        if self.worker:
+            self.worker.cancel()
+        self._sim_thread.quit()
+        self._sim_thread.wait()
+
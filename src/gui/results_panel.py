@@ -2,13 +2,42 @@ from __future__ import annotations
 
 from typing import List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import (QFrame, QHBoxLayout, QLabel,
                                QScrollArea, QVBoxLayout, QWidget)
 
 from ..core.cards import Card
-from .assets import asset_path, CARD_W, CARD_H
+from .assets import scaled_card_pixmap, CARD_W, CARD_H
+
+
+class _EntryWidget(QFrame):
+    """One result box: a title and the 4/2/1-card rows.
+
+    Every arrangement has the same shape, so the child widgets are built
+    once and ResultsPanel only re-points their text and pixmaps.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        lay = QVBoxLayout(self)
+        self.title_label = QLabel()
+        lay.addWidget(self.title_label)
+        self.rows: List[QHBoxLayout] = []
+        self.tags: List[QLabel] = []
+        self.card_labels: List[QLabel] = []
+        for label_text, n in ("4-card", 4), ("2-card", 2), ("1-card", 1):
+            row = QHBoxLayout()
+            tag = QLabel(label_text)
+            row.addWidget(tag)
+            for _ in range(n):
+                lab = QLabel()
+                row.addWidget(lab)
+                self.card_labels.append(lab)
+            lay.addLayout(row)
+            self.rows.append(row)
+            self.tags.append(tag)
+        self.last_key: tuple | None = None  # (title, cards, scale) last shown
 
 
 class ResultsPanel(QScrollArea):
@@ -33,6 +62,18 @@ class ResultsPanel(QScrollArea):
         # Simulation result entries: (title, hi, mid, low, win_rate)
         self._sim_entries: List[Tuple[str, Tuple[Card, ...], Tuple[Card, ...], Tuple[Card, ...], float]] = []
 
+        # Rebuilds are deferred to the event loop, so a burst of updates
+        # (a finished simulation adds up to four entries) renders once
+        self._rerender_timer = QTimer(self)
+        self._rerender_timer.setSingleShot(True)
+        self._rerender_timer.setInterval(0)
+        self._rerender_timer.timeout.connect(self._rerender)
+
+        # Live entry widgets, in display order, kept above a trailing stretch
+        # that pushes them to the top of the scroll area
+        self._entry_widgets: List[_EntryWidget] = []
+        self.v.addStretch(1)
+
     # ── Public API ──────────────────────────────────────────
 
     def show_house_way(
@@ -47,13 +88,13 @@ class ResultsPanel(QScrollArea):
         self._hw_low = tuple(low)
         self._hw_win_rate = None
         self._hw_is_best = False
-        self._rerender()
+        self._rerender_timer.start()
 
     def mark_house_way_as_best(self, win_rate: float):
         """Update the House Way entry to indicate it equals the simulated best."""
         self._hw_win_rate = win_rate
         self._hw_is_best = True
-        self._rerender()
+        self._rerender_timer.start()
 
     def show_result(
         self,
@@ -65,14 +106,14 @@ class ResultsPanel(QScrollArea):
     ):
         """Append a simulation result entry below the House Way."""
         self._sim_entries.append((title, tuple(hi), tuple(mid), tuple(low), win_rate))
-        self._rerender()
+        self._rerender_timer.start()
 
     def clear_sim_results(self):
         """Clear only simulation results, preserving the House Way."""
         self._sim_entries.clear()
         self._hw_win_rate = None
         self._hw_is_best = False
-        self._rerender()
+        self._rerender_timer.start()
 
     def clear_results(self):
         """Clear everything (House Way + simulation results)."""
@@ -80,25 +121,27 @@ class ResultsPanel(QScrollArea):
         self._hw_win_rate = None
         self._hw_is_best = False
         self._sim_entries.clear()
+        self._rerender_timer.stop()
         self._remove_widgets()
 
     def set_scale(self, scale: float):
         if abs(scale - self._scale) < 1e-3:
             return
         self._scale = scale
-        self._rerender()
+        self._rerender_timer.start()
 
     # ── Internal rendering ──────────────────────────────────
 
-    def _remove_widgets(self):
-        while self.v.count():
-            item = self.v.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
+    def _remove_widgets(self, keep: int = 0):
+        """Drop entry widgets past the first *keep*."""
+        while len(self._entry_widgets) > keep:
+            box = self._entry_widgets.pop()
+            self.v.removeWidget(box)
+            box.deleteLater()
 
+    @Slot()
     def _rerender(self):
-        self._remove_widgets()
+        entries = []
 
         # 1. House Way entry (always first)
         if self._hw_hi is not None:
@@ -106,55 +149,67 @@ class ResultsPanel(QScrollArea):
                 hw_title = f"House Way = Best — Win 2 of 3: {self._hw_win_rate:.2%}"
             else:
                 hw_title = "House Way"
-            self._render_entry(hw_title, self._hw_hi, self._hw_mid, self._hw_low,
-                               self._hw_win_rate)
+            entries.append((hw_title, self._hw_hi, self._hw_mid, self._hw_low,
+                            self._hw_win_rate))
 
         # 2. Simulation result entries
-        for title, hi, mid, low, wr in self._sim_entries:
-            self._render_entry(title, hi, mid, low, wr)
-
-        # Push entries to top so they don't stretch to fill the scroll area
-        self.v.addStretch(1)
-
-    def _render_entry(self, title: str, hi: Tuple[Card, ...], mid: Tuple[Card, ...],
-                      low: Tuple[Card, ...], win_rate: float | None):
-        box = QFrame()
-        box.setFrameShape(QFrame.Shape.StyledPanel)
-        lay = QVBoxLayout(box)
-        lay.setContentsMargins(
-            int(10 * self._scale),
-            int(8 * self._scale),
-            int(10 * self._scale),
-            int(8 * self._scale),
-        )
-        lay.setSpacing(int(6 * self._scale))
-
+        entries.extend(self._sim_entries)
+
+        # Existing entry widgets are updated in place; only the difference in
+        # count is created or dropped.  Painting is suspended meanwhile, so the
+        # whole pass costs one repaint.
+        container = self.widget()
+        container.setUpdatesEnabled(False)
+        try:
+            self._remove_widgets(keep=len(entries))
+            for i, entry in enumerate(entries):
+                if i == len(self._entry_widgets):
+                    self._create_entry()
+                self._update_entry(self._entry_widgets[i], entry)
+        finally:
+            container.setUpdatesEnabled(True)
+
+    def _create_entry(self):
+        box = _EntryWidget()
+        # Entries sit above the trailing stretch
+        self.v.insertWidget(len(self._entry_widgets), box)
+        self._entry_widgets.append(box)
+
+    def _update_entry(self, box: _EntryWidget, entry):
+        title, hi, mid, low, win_rate = entry
         if win_rate is not None:
             title_text = f"{title} — Win 2 of 3: {win_rate:.2%}" if "Win 2 of 3" not in title else title
         else:
             title_text = title
-        title_label = QLabel(title_text)
-        self._set_font_size(title_label, "title")
-        lay.addWidget(title_label)
+        cards = hi + mid + low
+        key = (title_text, cards, self._scale)
+        if box.last_key == key:
+            return
+        last = box.last_key
+        box.last_key = key
 
-        for label_text, group in ("4-card", hi), ("2-card", mid), ("1-card", low):
-            row = QHBoxLayout()
-            row.setSpacing(int(6 * self._scale))
-            tag = QLabel(label_text)
-            self._set_font_size(tag, "group")
-            row.addWidget(tag)
-            for card in group:
-                pix = QPixmap(asset_path(card)).scaled(
-                    int(CARD_W * self._card_ratio * self._scale),
-                    int(CARD_H * self._card_ratio * self._scale),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                lab = QLabel()
-                lab.setPixmap(pix)
-                row.addWidget(lab)
-            lay.addLayout(row)
-        self.v.addWidget(box)
+        box.title_label.setText(title_text)
+        if last is not None and last[1:] == key[1:]:
+            return
+
+        if last is None or last[2] != self._scale:
+            box.layout().setContentsMargins(
+                int(10 * self._scale),
+                int(8 * self._scale),
+                int(10 * self._scale),
+                int(8 * self._scale),
+            )
+            box.layout().setSpacing(int(6 * self._scale))
+            for row in box.rows:
+                row.setSpacing(int(6 * self._scale))
+            self._set_font_size(box.title_label, "title")
+            for tag in box.tags:
+                self._set_font_size(tag, "group")
+
+        w = int(CARD_W * self._card_ratio * self._scale)
+        h = int(CARD_H * self._card_ratio * self._scale)
+        for lab, card in zip(box.card_labels, cards):
+            lab.setPixmap(scaled_card_pixmap(card, w, h))
 
     def _set_font_size(self, label: QLabel, kind: str):
         font = label.font()
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from PySide6.QtCore import Qt, Signal, QSize, QEvent
-from PySide6.QtGui import QPixmap, QColor
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QGraphicsDropShadowEffect
 
 from ..core.cards import Card, JOKER
-from .assets import asset_path, CARD_W, CARD_H
+from .assets import scaled_card_pixmap, CARD_W, CARD_H
 
 _HOVER_SCALE = 1.07  # 7% scale-up on hover
 
@@ -35,6 +35,7 @@ class SelectedStatusBar(QFrame):
         self._scale = 0.0  # force first set_scale to apply
         self._cards: List[Optional[Card]] = [None] * 7
         self.slots: List[ClickableLabel] = []
+        self._slot_index: Dict[int, int] = {}  # slot position by id(label)
         self._slot_size: QSize = QSize(0, 0)
         
         for i in range(7):
@@ -44,14 +45,26 @@ class SelectedStatusBar(QFrame):
             lbl.clicked.connect(lambda i=i: self.on_slot_clicked(i))
             lbl.setAttribute(Qt.WidgetAttribute.WA_Hover)  # Enable hover events
             lbl.installEventFilter(self)  # Install event filter for hover effects
+            # Orange hover glow, built once and toggled by the hover helpers
+            shadow = QGraphicsDropShadowEffect(lbl)
+            shadow.setBlurRadius(25)
+            shadow.setColor(QColor(255, 87, 34, 255))
+            shadow.setOffset(0, 0)
+            shadow.setEnabled(False)
+            lbl.setGraphicsEffect(shadow)
             layout.addWidget(lbl)
+            self._slot_index[id(lbl)] = i
             self.slots.append(lbl)
         self.set_scale(1.0)
 
     def set_cards(self, cards: List[Optional[Card]]):
+        # Cards are interned, so an identity check finds the changed slots;
+        # a click usually changes one
         for idx in range(7):
-            self._cards[idx] = cards[idx] if idx < len(cards) else None
-        self._refresh_pixmaps()
+            card = cards[idx] if idx < len(cards) else None
+            if card is not self._cards[idx]:
+                self._cards[idx] = card
+                self._refresh_slot(idx)
 
     def set_scale(self, scale: float):
         if abs(scale - self._scale) < 1e-3:
@@ -75,22 +88,24 @@ class SelectedStatusBar(QFrame):
         self._refresh_pixmaps()
 
     def _refresh_pixmaps(self):
-        for lbl, card in zip(self.slots, self._cards):
-            if card is None:
-                lbl.clear()
-                lbl.setToolTip("")
-                self._remove_hover(lbl)
-            else:
-                pix = QPixmap(asset_path(card))
-                lbl.setPixmap(
-                    pix.scaled(
-                        lbl.width(),
-                        lbl.height(),
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                )
-                lbl.setToolTip(card.id())
+        # All seven slots change together; repaint once
+        self.setUpdatesEnabled(False)
+        try:
+            for idx in range(7):
+                self._refresh_slot(idx)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _refresh_slot(self, idx: int):
+        lbl = self.slots[idx]
+        card = self._cards[idx]
+        if card is None:
+            lbl.clear()
+            lbl.setToolTip("")
+            self._remove_hover(lbl)
+        else:
+            lbl.setPixmap(scaled_card_pixmap(card, lbl.width(), lbl.height()))
+            lbl.setToolTip(card.id())
 
     # ── Hover helpers ──────────────────────────────────────
 
@@ -119,29 +134,18 @@ class SelectedStatusBar(QFrame):
         lbl.setGeometry(cx - nw // 2, cy - nh // 2, nw, nh)
 
         # Re-scale the pixmap to the new size
-        idx = self.slots.index(lbl)
+        idx = self._slot_index[id(lbl)]
         card = self._cards[idx]
         if card is not None:
-            pix = QPixmap(asset_path(card))
-            lbl.setPixmap(
-                pix.scaled(
-                    nw, nh,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+            lbl.setPixmap(scaled_card_pixmap(card, nw, nh))
 
         # Orange glow
-        shadow = QGraphicsDropShadowEffect(lbl)
-        shadow.setBlurRadius(25)
-        shadow.setColor(QColor(255, 87, 34, 255))
-        shadow.setOffset(0, 0)
-        lbl.setGraphicsEffect(shadow)
+        lbl.graphicsEffect().setEnabled(True)
 
     def _remove_hover(self, lbl: ClickableLabel):
         """Restore a slot to its normal size and re-enable layout."""
         if not hasattr(lbl, '_hover_orig_geom'):
-            lbl.setGraphicsEffect(None)
+            lbl.graphicsEffect().setEnabled(False)
             return
 
         og = lbl._hover_orig_geom
@@ -149,20 +153,13 @@ class SelectedStatusBar(QFrame):
         # Restore original fixed size and position
         lbl.setFixedSize(og.size())
         lbl.setGeometry(og)
-        lbl.setGraphicsEffect(None)
+        lbl.graphicsEffect().setEnabled(False)
 
         # Re-scale pixmap back to normal size
-        idx = self.slots.index(lbl)
+        idx = self._slot_index[id(lbl)]
         card = self._cards[idx]
         if card is not None:
-            pix = QPixmap(asset_path(card))
-            lbl.setPixmap(
-                pix.scaled(
-                    og.width(), og.height(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+            lbl.setPixmap(scaled_card_pixmap(card, og.width(), og.height()))
 
         del lbl._hover_orig_geom
 
@@ -171,9 +168,8 @@ class SelectedStatusBar(QFrame):
     
     def eventFilter(self, obj, event):
         """Handle hover events for status bar slots."""
-        if isinstance(obj, ClickableLabel) and obj in self.slots:
-            idx = self.slots.index(obj)
-            
+        idx = self._slot_index.get(id(obj))
+        if idx is not None:
             # Only apply hover effect to filled slots
             if self._cards[idx] is not None:
                 if event.type() == QEvent.Type.Enter:
@@ -1,39 +1,82 @@
 from __future__ import annotations
 
-from typing import List, Sequence
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from typing import FrozenSet, List, Sequence, Tuple
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QThread, Signal, Slot
 
 from ..core.cards import Card
 from ..core.evaluator import evaluate_best_setup
 
 
+# Shortest gap between progress signals (~30 Hz), in seconds
+_PROGRESS_INTERVAL = 1 / 30
+
+# Finished (best, all_results) by (set of hand cards, samples), least
+# recently used first: re-running a hand at the same sample count, in any
+# selection order, shows the earlier estimate at once.
+_RESULT_CACHE: "OrderedDict[Tuple[FrozenSet[Card], int], tuple]" = OrderedDict()
+_RESULT_CACHE_SIZE = 64
+
+
 class SimWorker(QObject):
     progress = Signal(float)
     finished = Signal(object, object)  # best, all_results
-    error = Signal(str)
+    error = Signal(object, str)  # exception, formatted traceback
     canceled = Signal()
 
     def __init__(self, hand: Sequence[Card], samples: int):
         super().__init__()
-        self.hand = list(hand)
+        # Immutable snapshot: the caller (MainWindow.selected) is a live list
+        self.hand = tuple(hand)
         self.samples = int(samples)
-        self._cancel = False
+        # Set from the GUI thread; simulate_best polls it once per batch or
+        # progress poll, not per sample
+        self._cancel = threading.Event()
+        self._last_pct = -1
+        self._last_emit = 0.0
 
     def cancel(self):
-        self._cancel = True
+        self._cancel.set()
+
+    def _on_progress(self, f: float):
+        # The bar shows whole percents; only cross threads when one changes,
+        # and at most ~30 times a second however fast percents go by
+        pct = int(f * 100)
+        if pct == self._last_pct:
+            return
+        now = time.monotonic()
+        if now - self._last_emit < _PROGRESS_INTERVAL and pct < 100:
+            return
+        self._last_pct = pct
+        self._last_emit = now
+        self.progress.emit(f)
 
+    @Slot()
     def run(self):
+        key = (frozenset(self.hand), self.samples)
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+            self.progress.emit(1.0)
+            self.finished.emit(*cached)
+            return
         try:
             best, all_results = evaluate_best_setup(
                 self.hand,
                 samples=self.samples,
-                progress=self.progress.emit,
-                cancel=lambda: self._cancel,
+                progress=self._on_progress,
+                cancel=self._cancel.is_set,
             )
-            if self._cancel:
+            if self._cancel.is_set():
                 self.canceled.emit()
                 return
+            _RESULT_CACHE[key] = (best, all_results)
+            if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
             self.finished.emit(best, all_results)
         except Exception as e:
-            self.error.emit(str(e))
+            self.error.emit(e, traceback.format_exc())
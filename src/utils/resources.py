@@ -5,10 +5,14 @@ Handles path resolution for both development and frozen (PyInstaller) modes.
 """
 from __future__ import annotations
 
+import functools
 import os
 import sys
 from pathlib import Path
 
+# Whether this is a PyInstaller bundle; fixed for the process
+_FROZEN = bool(getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'))
+
 
 def is_frozen() -> bool:
     """
@@ -17,9 +21,17 @@ def is_frozen() -> bool:
     Returns:
         True if running as frozen executable, False if running from source.
     """
-    return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
+    return _FROZEN
+
+
+# Root that resource paths resolve against, fixed for the process:
+# PyInstaller extracts bundled files to sys._MEIPASS; in development it is the
+# project root (two levels up from this file)
+_BASE_PATH = (sys._MEIPASS if _FROZEN  # type: ignore[attr-defined]
+              else os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource, works in dev and frozen mode.
@@ -33,16 +45,28 @@ def get_resource_path(relative_path: str) -> str:
     Returns:
         Absolute path to the resource file.
     """
-    if is_frozen():
-        # PyInstaller extracts bundled files to sys._MEIPASS
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    else:
-        # In development, base is project root (two levels up from this file)
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+def _user_data_dir() -> str:
+    """
+    Get the platform-specific writable data directory used in frozen mode.
     
-    return os.path.join(base_path, relative_path)
+    Returns:
+        - Windows: %LOCALAPPDATA%/AsiaPoker421
+        - macOS: ~/Library/Application Support/AsiaPoker421
+        - Linux: ~/.local/share/AsiaPoker421
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Application Support')
+    else:
+        base = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
+    return os.path.join(base, 'AsiaPoker421')
 
 
+@functools.lru_cache(maxsize=None)
 def get_assets_dir() -> str:
     """
     Get path to assets/cards directory.
@@ -55,21 +79,12 @@ def get_assets_dir() -> str:
     
     Returns:
         Absolute path to assets directory (may not exist yet).
+
+    The result is cached, so the first-run copy is attempted once per process.
     """
-    if is_frozen():
+    if _FROZEN:
         # Use platform-specific user data directory for writable assets
-        if sys.platform == 'win32':
-            # Windows: %LOCALAPPDATA%/AsiaPoker421/assets/cards
-            base = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
-            assets_dir = os.path.join(base, 'AsiaPoker421', 'assets', 'cards')
-        elif sys.platform == 'darwin':
-            # macOS: ~/Library/Application Support/AsiaPoker421/assets/cards
-            base = os.path.expanduser('~/Library/Application Support')
-            assets_dir = os.path.join(base, 'AsiaPoker421', 'assets', 'cards')
-        else:
-            # Linux: ~/.local/share/AsiaPoker421/assets/cards
-            base = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
-            assets_dir = os.path.join(base, 'AsiaPoker421', 'assets', 'cards')
+        assets_dir = os.path.join(_user_data_dir(), 'assets', 'cards')
         
         # If bundled assets exist, try to copy them to user directory on first run
         bundled_assets = get_resource_path('assets/cards')
@@ -80,11 +95,9 @@ def get_assets_dir() -> str:
                 # Copy bundled assets to user directory
                 import shutil
                 try:
-                    for item in os.listdir(bundled_assets):
-                        src = os.path.join(bundled_assets, item)
-                        dst = os.path.join(assets_dir, item)
-                        if os.path.isfile(src) and not os.path.exists(dst):
-                            shutil.copy2(src, dst)
+                    # Contents only; read-only PNGs need no metadata copied
+                    shutil.copytree(bundled_assets, assets_dir, dirs_exist_ok=True,
+                                    copy_function=shutil.copy)
                 except Exception:
                     # If copy fails, assets will be generated on demand
                     pass
@@ -93,3 +106,18 @@ def get_assets_dir() -> str:
     else:
         # In development, use project's assets/cards directory
         return get_resource_path('assets/cards')
+
+
+def get_cache_dir() -> str:
+    """
+    Get path to the directory for generated data files (e.g. lookup tables).
+    
+    In development mode, uses the project's .cache directory.
+    In frozen mode, uses the user data directory (see get_assets_dir).
+    
+    Returns:
+        Absolute path to cache directory (may not exist yet).
+    """
+    if _FROZEN:
+        return os.path.join(_user_data_dir(), 'cache')
+    return get_resource_path('.cache')